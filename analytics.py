@@ -0,0 +1,534 @@
+"""
+Headless analytics behind the dashboard pages, without any Streamlit dependency.
+
+The tables and series of every page are pure functions of the loaded data and the page
+parameters. Analytics holds the data of one dataset version (latest list, prepared history
+and its indexes), memoizes results per parameter set in a bounded LRU and reads series that
+were precomputed into a ResultStore. app.py is a thin view over an Analytics instance.
+
+The batch mode evaluates the full parameter grid of the cohort pages (birthyears x genders x
+disciplines x FIS years, and every top X of the development chart) in a process pool and
+writes one table per series, e.g. overnight after build_fis_history.py:
+
+Usage:
+    python analytics.py --store data/fis_list_combined --workers 4
+"""
+import argparse
+import os
+import pickle
+import shutil
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+from cube import CUBE_THRESHOLDS, CohortCube, read_cube
+from fis_schema import LATEST_LIST_COLUMNS, read_fis_list
+from instrumentation import record_cache, record_memory, stage
+from mapped import open_mapped
+from prepare import prepare_combined_data
+from shared import freeze
+from storage import dataset_version, listyear_from_listname, read_history
+from utils import (
+    CohortIndex,
+    RankingIndex,
+    TrajectoryIndex,
+    calculate_statistics,
+    cohorts_over_birthyears,
+    cohorts_over_seasons,
+    collect_data_Entw_disciplines,
+    collect_data_grid,
+    collect_data_No,
+    collect_data_tops,
+    sorted_by,
+)
+
+DEFAULT_STORE = os.path.join("data", "fis_list_combined")
+DEFAULT_LATEST_LIST = os.path.join("data", "FIS-points-list-AL-2025-413.csv")
+
+# Parameter ranges of the cohort pages
+BIRTHYEARS = list(range(1994, 2012))
+FIS_YEARS = list(range(1, 6))
+GENDERS = ['M', 'W']
+DISCIPLINES = ['DH', 'SL', 'GS', 'SG', 'AC']
+DEVELOPMENT_DISCIPLINES = ['DH', 'SG', 'SL', 'GS']
+BIRTHYEAR_TOPS = [3, 10, 15]
+DEVELOPMENT_TOPS = list(range(3, 51))
+
+# History columns of the development pages (all disciplines, so both share one prepared frame)
+DEVELOPMENT_COLUMNS = ("listyear", "birthyear", "gender", "nationcode", "competitorid", "competitorname", "dhpos", "sgpos", "slpos", "gspos")
+COHORT_COLUMNS = ("listyear", "birthyear", "gender", "nationcode", "dhpos", "slpos", "gspos", "sgpos", "acpos")
+# Columns of the one prepared frame per gender, the pages and indexes use views of it
+PREPARED_COLUMNS = tuple(dict.fromkeys(COHORT_COLUMNS + DEVELOPMENT_COLUMNS))
+
+
+def load_history(store, pickle_path=None, columns=None, gender=None):
+    """
+    Combined FIS history from the partitioned dataset at ``store``, only the requested columns
+    and gender. Falls back to the legacy pickle; None if neither exists.
+    """
+    if os.path.isdir(store):
+        return read_history(store, columns=columns, gender=gender)
+    if pickle_path is None or not os.path.exists(pickle_path):
+        return None
+    with open(pickle_path, 'rb') as f:
+        combined_df = pickle.load(f)
+    combined_df.columns = list(map(str.lower, combined_df.columns))
+    combined_df['listyear'] = listyear_from_listname(combined_df['listname'])
+    if gender is not None:
+        combined_df = combined_df[combined_df['gender'] == gender]
+    if columns is not None:
+        combined_df = combined_df[[col for col in dict.fromkeys(columns) if col in combined_df.columns]]
+    return combined_df
+
+
+def history_version(store, pickle_path=None):
+    return dataset_version(store) or (dataset_version(pickle_path) if pickle_path else None)
+
+
+### PAGE RESULTS ###
+def top3_tables(ranking, birthyear, gender, disciplines=RankingIndex.DISCIPLINES):
+    """
+    "Top 3": {discipline: table} for all nations and for SUI of one birthyear and gender.
+    """
+    birthyears = (birthyear, birthyear)
+    tables = {d: ranking.top_table(d, 3, birthyears, gender) for d in disciplines}
+    tables_sui = {d: ranking.top_table(d, 3, birthyears, gender, "SUI") for d in disciplines}
+    return tables, tables_sui
+
+
+def topX_tables(ranking, birthyears, gender, top, top_sui=5, disciplines=RankingIndex.DISCIPLINES):
+    """
+    "Top X": {discipline: table} of the best ``top`` athletes and the best ``top_sui`` SUI athletes
+    of a (from, to) birthyear range.
+    """
+    tables = {d: ranking.top_table(d, top, birthyears, gender) for d in disciplines}
+    tables_sui = {d: ranking.top_table(d, top_sui, birthyears, gender, "SUI") for d in disciplines}
+    return tables, tables_sui
+
+
+def season_counts(cohort_index, birthyear, FISYear, Gender, disciplin, thresholds=CUBE_THRESHOLDS):
+    """
+    "Year of birth and Season #": SUI athletes among the best N of 11 birthyears, columns top{N}.
+    """
+    return collect_data_No(birthyear, FISYear, Gender, disciplin, cohort_index, list(thresholds))
+
+
+def birthyear_over_seasons(cohort_index, birthyear, FISYear, Gender, disciplin, tops=BIRTHYEAR_TOPS):
+    """
+    "Year of birth over seasons": mean Int/SUI top k positions of 11 birthyears as one long
+    table with a ``top`` column (see split_series).
+    """
+    df_results = collect_data_tops(birthyear, FISYear, Gender, list(tops), disciplin, cohort_index)
+    return pd.concat([df.assign(top=top) for top, df in df_results.items()], ignore_index=True)
+
+
+def development_over_seasons(cohort_index, birthyear, FISYear, Gender, top, disciplines=DEVELOPMENT_DISCIPLINES):
+    """
+    "Year of birth Development over Seasons": mean Int/SUI top X positions of one birthyear over
+    11 seasons as one long table with a ``disciplin`` column (see split_series).
+    """
+    df_results = collect_data_Entw_disciplines(birthyear, FISYear, Gender, top, list(disciplines), cohort_index)
+    return pd.concat([df.assign(disciplin=disciplin) for disciplin, df in df_results.items()], ignore_index=True)
+
+
+def band_statistics(combined_df, latest, Gender, disciplin, top, x="fisyearathlete", nation="SUI"):
+    """
+    Mean and band (calculate_statistics) of the positions of the current top ``top`` ``nation``
+    athletes in ``disciplin`` over their history, by ``x`` (fisyearathlete or athleteage).
+    """
+    latest = latest[(latest["gender"].str.upper() == Gender.upper()) & (latest["nationcode"] == nation)]
+    col_name = f"{disciplin.lower()}pos"
+    df_topX = latest.nsmallest(top, col_name)[["competitorid", "competitorname"]]
+    topX_pos = combined_df[
+        combined_df['competitorid'].isin(df_topX['competitorid'])
+    ][[x, 'competitorid', col_name, 'listyear']].dropna(subset=[col_name])
+    return calculate_statistics(topX_pos.rename(columns={x: 'fisyear'}), col_name)
+
+
+def split_series(df, column):
+    """
+    {value: DataFrame} of a long table from birthyear_over_seasons / development_over_seasons.
+    """
+    return {value: part.drop(columns=column).reset_index(drop=True) for value, part in df.groupby(column, sort=False)}
+
+
+### PRECOMPUTED RESULTS ###
+def season_counts_batch(cohort_index, Gender, birthyear):
+    return {(birthyear, FISYear, Gender, disciplin): season_counts(cohort_index, birthyear, FISYear, Gender, disciplin)
+            for FISYear in FIS_YEARS for disciplin in DISCIPLINES}
+
+
+def birthyear_over_seasons_batch(cohort_index, Gender, birthyear):
+    cohorts = {FISYear: cohorts_over_birthyears(birthyear, FISYear) for FISYear in FIS_YEARS}
+    grid = collect_data_grid(cohorts, Gender, BIRTHYEAR_TOPS, DISCIPLINES, cohort_index)
+    return {
+        (birthyear, FISYear, Gender, disciplin): pd.concat(
+            [grid[(FISYear, disciplin, top)].assign(top=top) for top in BIRTHYEAR_TOPS], ignore_index=True)
+        for FISYear in FIS_YEARS for disciplin in DISCIPLINES
+    }
+
+
+def development_over_seasons_batch(cohort_index, Gender, birthyear):
+    cohorts = {FISYear: cohorts_over_seasons(birthyear, FISYear) for FISYear in FIS_YEARS}
+    grid = collect_data_grid(cohorts, Gender, DEVELOPMENT_TOPS, DEVELOPMENT_DISCIPLINES, cohort_index)
+    return {
+        (birthyear, FISYear, Gender, top): pd.concat(
+            [grid[(FISYear, disciplin, top)].assign(disciplin=disciplin) for disciplin in DEVELOPMENT_DISCIPLINES], ignore_index=True)
+        for FISYear in FIS_YEARS for top in DEVELOPMENT_TOPS
+    }
+
+
+# Series of the batch mode: name -> (function, parameter names, all results of one gender and birthyear)
+SERIES = {
+    'season_counts': (season_counts, ['birthyear', 'FISYear', 'Gender', 'disciplin'], season_counts_batch),
+    'birthyear_over_seasons': (birthyear_over_seasons, ['birthyear', 'FISYear', 'Gender', 'disciplin'], birthyear_over_seasons_batch),
+    'development_over_seasons': (development_over_seasons, ['birthyear', 'FISYear', 'Gender', 'top'], development_over_seasons_batch),
+}
+
+
+class ResultStore:
+    """
+    Precomputed series of one data version, one parquet table per series under
+    ``directory/<version>/``. The parameters of every result are stored in ``param_*`` columns.
+    """
+
+    def __init__(self, directory, version):
+        self.directory = directory
+        self.path = os.path.join(directory, str(version))
+        self.tables = {}
+
+    def _file(self, name):
+        return os.path.join(self.path, name + ".parquet")
+
+    def table(self, name):
+        if name not in self.tables:
+            path = self._file(name)
+            table = None
+            if os.path.exists(path):
+                df = pd.read_parquet(path)
+                table = df.set_index([col for col in df.columns if col.startswith('param_')]).sort_index()
+            self.tables[name] = table
+        return self.tables[name]
+
+    def get(self, name, params):
+        table = self.table(name)
+        if table is None:
+            return None
+        try:
+            return table.loc[tuple(params)].reset_index(drop=True)
+        except KeyError:
+            return None
+
+    def write(self, name, param_names, results):
+        """
+        Write ``results`` ({params: DataFrame}) as the table of series ``name``.
+        """
+        frames = [df.assign(**{f'param_{p}': v for p, v in zip(param_names, params)}) for params, df in results.items()]
+        os.makedirs(self.path, exist_ok=True)
+        tmp_path = self._file(name) + ".tmp"
+        pd.concat(frames, ignore_index=True).to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, self._file(name))
+        self.tables.pop(name, None)
+
+    def other_versions(self):
+        """
+        Result directories of other (stale) data versions.
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        paths = [os.path.join(self.directory, entry) for entry in os.listdir(self.directory)]
+        return [path for path in paths if os.path.isdir(path) and path != self.path]
+
+    def remove_other_versions(self):
+        for path in self.other_versions():
+            shutil.rmtree(path)
+
+
+def _label(key):
+    if isinstance(key, str):
+        return key
+    return " ".join(f"{len(part)} columns" if isinstance(part, tuple) else str(part) for part in key)
+
+
+def results_directory(store):
+    return os.path.join(os.path.dirname(os.path.abspath(store)), "analytics_results")
+
+
+class Analytics:
+    """
+    Data and results of one history version. Data (latest list, one prepared history per gender
+    with its indexes) is loaded once, a fixed set of entries; results are memoized per parameters in an LRU of
+    ``max_results`` entries and taken from the ResultStore if they were precomputed. The prepared
+    history is opened from the memory-mapped layout (mapped.py) if it was written for this version.
+    Rendered PNGs of the birth-year charts are kept in an LRU of their own (``max_charts``).
+    Loaded data and memoized results are shared read-only (see shared.freeze), callers derive new frames.
+    Safe to share between the threads of the Streamlit sessions.
+    """
+
+    def __init__(self, store=DEFAULT_STORE, latest_list=DEFAULT_LATEST_LIST, pickle_path=None,
+                 results_dir=None, max_results=512, max_charts=64):
+        self.store = store
+        self.latest_list = latest_list
+        self.pickle_path = pickle_path
+        self.version = history_version(store, pickle_path)
+        if results_dir is None:
+            results_dir = results_directory(store)
+        self.results = ResultStore(results_dir, self.version)
+        self.max_results = max_results
+        self.max_charts = max_charts
+        self._data = {}
+        self._memo = OrderedDict()
+        self._charts = OrderedDict()
+        self._lock = threading.Lock()
+        self._load_locks = {}
+        self.warm_up_timings = []
+
+    def _load(self, key, load, name=None):
+        name = name or (key if isinstance(key, str) else key[0])
+        # One lock per dataset, so concurrent sessions wait for a load instead of repeating it
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        with load_lock:
+            record_cache(name, key in self._data)
+            if key not in self._data:
+                with stage(name):
+                    self._data[key] = freeze(load())
+                record_memory(_label(key), self._data[key])
+        return self._data[key]
+
+    def _cached(self, key, compute, memo=None, max_entries=None):
+        memo = self._memo if memo is None else memo
+        max_entries = max_entries or self.max_results
+        with self._lock:
+            hit = key in memo
+            record_cache(key[0], hit)
+            if hit:
+                memo.move_to_end(key)
+                return memo[key]
+        with stage(key[0]):
+            result = freeze(compute())
+        with self._lock:
+            memo[key] = result
+            if len(memo) > max_entries:
+                memo.popitem(last=False)
+        return result
+
+    def _series(self, name, params, cohort_index):
+        def compute():
+            result = self.results.get(name, params)
+            if result is None:
+                result = SERIES[name][0](cohort_index(), *params)
+            return result
+        return self._cached((name,) + tuple(params), compute)
+
+    ### DATA ###
+    def latest(self):
+        return self._load('latest', lambda: read_fis_list(self.latest_list, columns=LATEST_LIST_COLUMNS), "get_latest_fis_list")
+
+    def ranking(self):
+        return self._load('ranking', lambda: RankingIndex(self.latest()))
+
+    def prepared(self, columns=None, gender=None):
+        """
+        Prepared history of ``gender`` (None: all) with the PREPARED_COLUMNS, sorted by
+        CohortIndex.KEYS, loaded once. ``columns`` returns a view of some of them, without a copy.
+        """
+        def load():
+            # Memory-mapped prepared history (mapped.py), shared with the other processes
+            with stage("open_mapped"):
+                combined_df = open_mapped(self.store, self.version, PREPARED_COLUMNS, gender)
+            if combined_df is not None:
+                return combined_df
+            with stage("load_combined_data"):
+                combined_df = load_history(self.store, self.pickle_path, columns=PREPARED_COLUMNS, gender=gender)
+            if combined_df is None:
+                return None
+            with stage("prepare_combined_data"):
+                # In the order of CohortIndex, so the index is built without another copy
+                return sorted_by(prepare_combined_data(combined_df), CohortIndex.KEYS)
+
+        combined_df = self._load(('prepared', gender), load, "load_combined_data (prepared)")
+        if combined_df is None or columns is None:
+            return combined_df
+        wanted = set(columns) | {'fisyearathlete', 'athleteage'}
+        return freeze(pd.DataFrame({col: combined_df[col] for col in combined_df.columns if col in wanted}, copy=False))
+
+    def cube(self):
+        def load():
+            cube = read_cube(self.store) if os.path.isdir(self.store) else None
+            return CohortCube(cube) if cube is not None else None
+        return self._load('cube', load)
+
+    def cohort_index(self, gender=None):
+        def load():
+            combined_df = self.prepared(gender=gender)
+            return CohortIndex(combined_df, cube=self.cube()) if combined_df is not None else None
+        return self._load(('cohort_index', gender), load)
+
+    def trajectories(self, gender):
+        def load():
+            combined_df = self.prepared(gender=gender)
+            return TrajectoryIndex(combined_df) if combined_df is not None else None
+        return self._load(('trajectories', gender), load)
+
+    ### RESULTS ###
+    def top3_tables(self, birthyear, gender):
+        return self._cached(('top3_tables', birthyear, gender), lambda: top3_tables(self.ranking(), birthyear, gender))
+
+    def topX_tables(self, birthyears, gender, top, top_sui=5):
+        birthyears = (min(birthyears), max(birthyears))
+        return self._cached(('topX_tables', birthyears, gender, top, top_sui),
+                            lambda: topX_tables(self.ranking(), birthyears, gender, top, top_sui))
+
+    def season_counts(self, birthyear, FISYear, Gender, disciplin, thresholds=CUBE_THRESHOLDS):
+        if all(top in CUBE_THRESHOLDS for top in thresholds):
+            df = self._series('season_counts', (birthyear, FISYear, Gender, disciplin), lambda: self.cohort_index(Gender))
+            return df[['birthyear', 'season'] + [f'top{top}' for top in thresholds]]
+        return season_counts(self.cohort_index(Gender), birthyear, FISYear, Gender, disciplin, thresholds)
+
+    def birthyear_over_seasons(self, birthyear, FISYear, Gender, disciplin):
+        df = self._series('birthyear_over_seasons', (birthyear, FISYear, Gender, disciplin), lambda: self.cohort_index(Gender))
+        return split_series(df, 'top')
+
+    def development_over_seasons(self, birthyear, FISYear, Gender, top):
+        df = self._series('development_over_seasons', (birthyear, FISYear, Gender, top), lambda: self.cohort_index(Gender))
+        return split_series(df, 'disciplin')
+
+    def band_statistics(self, Gender, disciplin, top, x="fisyearathlete", nation="SUI"):
+        return self._cached(('band_statistics', Gender, disciplin, top, x, nation),
+                            lambda: band_statistics(self.prepared(DEVELOPMENT_COLUMNS, Gender), self.latest(),
+                                                    Gender, disciplin, top, x, nation))
+
+    def chart_png(self, kind, birthyear, FISYear, Gender, last):
+        """
+        PNG of a birth-year page chart: ``kind`` "birthyear_over_seasons" (``last`` is the
+        discipline) or "development_over_seasons" (``last`` is the top X). Rendered once per input,
+        so reruns and repeated views do not re-rasterize the 300 dpi figure.
+        """
+        def render():
+            # matplotlib is imported with the first chart, not with this module
+            from charts import birthyear_over_seasons_figure, development_over_seasons_figure, figure_png
+            if kind == 'birthyear_over_seasons':
+                fig = birthyear_over_seasons_figure(self.birthyear_over_seasons(birthyear, FISYear, Gender, last), last)
+            else:
+                fig = development_over_seasons_figure(self.development_over_seasons(birthyear, FISYear, Gender, last), last)
+            with stage("matplotlib render"):
+                return figure_png(fig)
+
+        return self._cached(('chart_png', kind, birthyear, FISYear, Gender, last), render, self._charts, self.max_charts)
+
+    ### WARM-UP ###
+    def default_steps(self):
+        """
+        (name, callable) loading the data and computing the default view of every page,
+        with the widget defaults of app.py.
+        """
+        def topX_default():
+            birthyears = self.latest()["birthyear"]
+            return self.topX_tables((1997, int(birthyears.max())), 'M', 20)
+
+        def athletes_default():
+            combined_df = self.prepared(DEVELOPMENT_COLUMNS, 'M')
+            names = combined_df.drop_duplicates('competitorid').set_index('competitorname')['competitorid']
+            trajectories = self.trajectories('M')
+            return [trajectories.get(names[name]) for name in ("ODERMATT Marco", "VON ALLMEN Franjo") if name in names]
+
+        return [
+            ("latest list", self.latest),
+            ("ranking index", self.ranking),
+            ("cohort cube", self.cube),
+            ("Top 3", lambda: self.top3_tables(1997, 'M')),
+            ("Top X", topX_default),
+            ("Year of birth and Season #", lambda: self.season_counts(1998, 1, 'M', 'DH', (30, 50, 70))),
+            ("Year of birth over seasons", lambda: self.birthyear_over_seasons(1998, 1, 'M', 'DH')),
+            ("Year of birth Development over Seasons", lambda: self.development_over_seasons(1998, 1, 'M', 10)),
+            ("Year of birth over seasons chart", lambda: self.chart_png('birthyear_over_seasons', 1998, 1, 'M', 'DH')),
+            ("Year of birth Development over Seasons chart", lambda: self.chart_png('development_over_seasons', 1998, 1, 'M', 10)),
+            ("development history M", lambda: self.prepared(DEVELOPMENT_COLUMNS, 'M')),
+            ("trajectory index M", lambda: self.trajectories('M')),
+            ("Current Top Athletes - Development", lambda: self.band_statistics('M', 'DH', 30, "fisyearathlete")),
+            ("Athlete - All Disciplines - Development",
+             lambda: [self.band_statistics('M', d, 30, "athleteage") for d in DEVELOPMENT_DISCIPLINES]),
+            ("default athletes", athletes_default),
+        ]
+
+    def warm_up(self, extra_steps=(), log=print):
+        """
+        Run default_steps() and ``extra_steps``, e.g. in a background thread when the server starts,
+        so the first visitor finds the data loaded and the default views cached. The time of
+        every step is kept in warm_up_timings as (step, seconds).
+        """
+        start = time.perf_counter()
+        for name, step in self.default_steps() + list(extra_steps):
+            step_start = time.perf_counter()
+            try:
+                step()
+            except Exception as e:
+                log(f"warm-up: {name} failed: {e!r}")
+                continue
+            seconds = time.perf_counter() - step_start
+            self.warm_up_timings.append((name, seconds))
+            log(f"warm-up: {name} {seconds:.2f}s")
+        log(f"warm-up: done in {time.perf_counter() - start:.2f}s")
+        return self.warm_up_timings
+
+
+### BATCH MODE ###
+_worker = None
+
+
+def _init_worker(store, pickle_path):
+    global _worker
+    _worker = Analytics(store, pickle_path=pickle_path)
+
+
+def _compute_chunk(name, Gender, birthyear):
+    batch = SERIES[name][2]
+    return name, batch(_worker.cohort_index(Gender), Gender, birthyear)
+
+
+def precompute(store=DEFAULT_STORE, pickle_path=None, results_dir=None, workers=None, series=None, log=print):
+    """
+    Compute every parameter combination of the cohort page series in a process pool and write
+    them to the ResultStore of the current data version. Results of older versions are removed.
+    """
+    analytics = Analytics(store, pickle_path=pickle_path, results_dir=results_dir)
+    if analytics.version is None:
+        raise FileNotFoundError(f"FIS history not found at {store}")
+    names = list(series or SERIES)
+    chunks = [(name, Gender, birthyear) for name in names for Gender in GENDERS for birthyear in BIRTHYEARS]
+    results = {name: {} for name in names}
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(store, pickle_path)) as pool:
+        futures = [pool.submit(_compute_chunk, *chunk) for chunk in chunks]
+        for done, future in enumerate(as_completed(futures), 1):
+            name, chunk_results = future.result()
+            results[name].update(chunk_results)
+            log(f"[{done}/{len(chunks)}] {time.perf_counter() - start:.1f}s")
+
+    for name in names:
+        analytics.results.write(name, SERIES[name][1], results[name])
+        log(f"Wrote {len(results[name])} {name} results")
+    analytics.results.remove_other_versions()
+    return analytics.results.path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Precompute the cohort page series for all parameter combinations.")
+    parser.add_argument("--store", default=DEFAULT_STORE, help="Dataset directory")
+    parser.add_argument("--pickle", help="Legacy combined pickle, used if the dataset does not exist")
+    parser.add_argument("--results", help="Results directory (default: analytics_results next to the store)")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: number of CPUs)")
+    parser.add_argument("--series", nargs="+", choices=list(SERIES), help="Only these series")
+    args = parser.parse_args()
+
+    try:
+        path = precompute(args.store, args.pickle, args.results, args.workers, args.series)
+    except FileNotFoundError as e:
+        sys.exit(str(e))
+    print(f"Results in {path}")
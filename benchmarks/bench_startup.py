@@ -0,0 +1,84 @@
+"""
+Cold-start import time of the dashboard, checked against a budget.
+
+Imports the modules of every script run (app core) and of each page module in fresh Python
+processes and reports the median wall time. Fails (exit code 1) if the app core exceeds its
+budget or loads matplotlib, which belongs to the chart page modules only.
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --budget-ms 1000 --repeat 7
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules app.py imports on every script run, before the selected page
+CORE = ["streamlit", "pandas", "streamlit_option_menu", "instrumentation", "views.common"]
+PAGE_MODULES = ["views.top3", "views.top_x", "views.season_counts", "views.birthyear_charts",
+                "views.development", "views.diagnostics"]
+# Plotting libraries of the chart pages. plotly is not listed: streamlit itself imports it
+# (for its chart theme) when it is installed
+HEAVY = ["matplotlib"]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+for name in sys.argv[2:]:
+    __import__(name)
+core_s = time.perf_counter() - start
+start = time.perf_counter()
+if sys.argv[1]:
+    __import__(sys.argv[1])
+page_s = time.perf_counter() - start
+print(json.dumps({"core_s": core_s, "page_s": page_s, "modules": sorted(sys.modules)}))
+"""
+
+
+def probe(page="", core=CORE):
+    """
+    Import ``core`` and then ``page`` in a fresh interpreter. Returns the two wall times and the
+    loaded modules.
+    """
+    out = subprocess.run([sys.executable, "-c", _PROBE, page] + list(core), cwd=ROOT,
+                         capture_output=True, text=True, check=True).stdout
+    return json.loads(out.splitlines()[-1])
+
+
+def run(repeat, log=print):
+    results = {}
+    core = [probe() for _ in range(repeat)]
+    results["app core"] = statistics.median(r["core_s"] for r in core)
+    heavy = sorted({name.split('.')[0] for name in core[0]["modules"] if name.split('.')[0] in HEAVY})
+    log(f"{'import':28s} {'median ms':>10s}")
+    log(f"{'app core':28s} {1000 * results['app core']:10.1f}")
+    for page in PAGE_MODULES:
+        results[page] = statistics.median(probe(page)["page_s"] for _ in range(repeat))
+        log(f"{'+ ' + page:28s} {1000 * results[page]:10.1f}")
+    return results, heavy
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Measure the cold-start import time of the dashboard.")
+    parser.add_argument("--budget-ms", type=float, default=1200, help="Import budget of the app core")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh processes per measurement")
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    args = parser.parse_args()
+
+    results, heavy = run(args.repeat)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+    failures = []
+    if heavy:
+        failures.append(f"app core imports {', '.join(heavy)}")
+    if 1000 * results["app core"] > args.budget_ms:
+        failures.append(f"app core import {1000 * results['app core']:.0f} ms > budget {args.budget_ms:.0f} ms")
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    sys.exit(1 if failures else 0)
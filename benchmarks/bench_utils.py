@@ -0,0 +1,142 @@
+"""
+Micro-benchmarks for the analysis functions in utils.py on synthetic FIS histories.
+
+Reports the median and best wall time per call and the peak Python memory (tracemalloc)
+for every function and history scale. Results can be saved as JSON and compared with a
+previous run to see how a change affects each function.
+
+Usage:
+    python benchmarks/bench_utils.py                       # scales 1 and 10
+    python benchmarks/bench_utils.py --scale 1 10 100 --seasons 30
+    python benchmarks/bench_utils.py --json after.json --compare before.json
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+import warnings
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from prepare import prepare_combined_data  # noqa: E402
+from synthetic import generate_history  # noqa: E402
+from utils import (  # noqa: E402
+    CohortIndex,
+    RankingIndex,
+    TrajectoryIndex,
+    calculate_statistics,
+    collect_data,
+    collect_data_Entw,
+    collect_data_No,
+    top_table,
+)
+
+BIRTHYEAR = 1998
+FISYEAR = 1
+GENDER = 'M'
+DISCIPLIN = 'DH'
+
+
+def measure(func, repeat):
+    """
+    Median and best wall time over ``repeat`` calls and peak traced memory of one extra call.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"median_s": statistics.median(times), "min_s": min(times), "peak_mb": peak / 1e6}
+
+
+def build_cases(seasons, scale):
+    """
+    Benchmark cases (name -> zero-argument callable) on a synthetic history of the given size.
+    """
+    raw = generate_history(seasons=seasons, scale=scale)
+    combined_df = prepare_combined_data(raw)
+    cohort_index = CohortIndex(combined_df)
+    trajectories = TrajectoryIndex(combined_df)
+
+    latest = raw[raw['Listid'] == raw['Listid'].max()].copy()
+    latest.columns = latest.columns.str.lower()
+    latest_m = latest[latest['gender'] == GENDER]
+    latest_by = latest_m[latest_m['birthyear'] == BIRTHYEAR]
+    ranking = RankingIndex(latest)
+
+    # Same input as the "Current Top Athletes - Development" page
+    col_name = f"{DISCIPLIN.lower()}pos"
+    top_ids = latest_m[latest_m['nationcode'] == 'SUI'].nsmallest(30, col_name)['competitorid']
+    fisyear_pos = combined_df[combined_df['competitorid'].isin(top_ids)][['fisyearathlete', 'competitorid', col_name]]
+    fisyear_pos = fisyear_pos.dropna(subset=[col_name]).rename(columns={'fisyearathlete': 'fisyear'})
+
+    # Athletes selected on the "Athlete - All Disciplines - Development" page
+    sui_ids = combined_df.loc[combined_df['nationcode'] == 'SUI', 'competitorid'].unique()[:2]
+    combined_df_sui = combined_df[combined_df['nationcode'] == 'SUI']
+
+    return len(combined_df), {
+        "collect_data (DataFrame)": lambda: collect_data(BIRTHYEAR, FISYEAR, GENDER, 10, DISCIPLIN, combined_df),
+        "collect_data (CohortIndex)": lambda: collect_data(BIRTHYEAR, FISYEAR, GENDER, 10, DISCIPLIN, cohort_index),
+        "collect_data_No (CohortIndex)": lambda: collect_data_No(BIRTHYEAR, FISYEAR, GENDER, DISCIPLIN, cohort_index),
+        "collect_data_Entw (CohortIndex)": lambda: collect_data_Entw(BIRTHYEAR, FISYEAR, GENDER, 10, DISCIPLIN, cohort_index),
+        "CohortIndex build": lambda: CohortIndex(combined_df),
+        "calculate_statistics": lambda: calculate_statistics(fisyear_pos, col_name),
+        "create_table top 3 x4": lambda: [top_table(latest_by, d, 3) for d in ["sl", "gs", "sg", "dh"]],
+        "create_table top 300 x4": lambda: [top_table(latest_m, d, 300) for d in ["sl", "gs", "sg", "dh"]],
+        "athlete lookup x8 (scan)": lambda: [combined_df_sui[combined_df_sui['competitorid'] == cid][['athleteage', f"{d}pos"]]
+                                             for cid in sui_ids for d in ["dh", "sg", "sl", "gs"]],
+        "athlete lookup x8 (TrajectoryIndex)": lambda: [trajectories.positions(cid, f"{d}pos", x='athleteage')
+                                                        for cid in sui_ids for d in ["dh", "sg", "sl", "gs"]],
+        "TrajectoryIndex build": lambda: TrajectoryIndex(combined_df),
+        "RankingIndex build": lambda: RankingIndex(latest),
+        "RankingIndex top 3 x4": lambda: [ranking.top_table(d, 3, (BIRTHYEAR, BIRTHYEAR), GENDER) for d in ["sl", "gs", "sg", "dh"]],
+        "RankingIndex top 300 x4": lambda: [ranking.top_table(d, 300, None, GENDER) for d in ["sl", "gs", "sg", "dh"]],
+    }
+
+
+def run(scales, seasons, repeat, log=print):
+    results = {}
+    for scale in scales:
+        rows, cases = build_cases(seasons, scale)
+        log(f"\nscale {scale:g}x: {rows} history rows ({seasons} seasons)")
+        log(f"{'benchmark':38s} {'median ms':>10s} {'min ms':>10s} {'peak MB':>9s}")
+        for name, func in cases.items():
+            result = measure(func, repeat)
+            results.setdefault(name, {})[f"{scale:g}"] = result
+            log(f"{name:38s} {1000 * result['median_s']:10.2f} {1000 * result['min_s']:10.2f} {result['peak_mb']:9.1f}")
+    return results
+
+
+def compare(results, baseline, log=print):
+    log("\nmedian time vs baseline (ratio < 1 is faster)")
+    for name, by_scale in results.items():
+        for scale, result in by_scale.items():
+            base = baseline.get(name, {}).get(scale)
+            if base:
+                log(f"{name:38s} {scale:>5s}x {result['median_s'] / base['median_s']:6.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the utils.py analysis functions on synthetic FIS histories.")
+    parser.add_argument("--scale", type=float, nargs="+", default=[1, 10], help="Athletes per list relative to today (~13k)")
+    parser.add_argument("--seasons", type=int, default=16, help="Number of seasons in the history")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed calls per benchmark")
+    parser.add_argument("--json", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON file of a previous run to compare against")
+    args = parser.parse_args()
+
+    warnings.simplefilter("ignore")
+    results = run(args.scale, args.seasons, args.repeat)
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump({"seasons": args.seasons, "results": results}, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            compare(results, json.load(f)["results"])
@@ -0,0 +1,159 @@
+"""
+Synthetic FIS points lists with the real column schema (see fis_schema.py).
+
+Keeps the benchmarks runnable offline without the private OneDrive lists. Athletes persist
+over seasons (same competitorid, birthyear, nation), are ranked in a discipline with a
+discipline-specific probability and get positions from their points, per gender.
+
+Usage:
+    python benchmarks/synthetic.py out_dir --seasons 30 --scale 10   # writes FIS-points-list-AL-YYYY-NNN.csv
+    python benchmarks/synthetic.py out_dir --lists-per-season 20      # every list of a season
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fis_schema import FIS_LIST_SCHEMA  # noqa: E402
+
+ATHLETES_PER_LIST = 13000
+NATIONS = ['AUT', 'SUI', 'ITA', 'FRA', 'GER', 'USA', 'NOR', 'CAN', 'SWE', 'SLO',
+           'CZE', 'JPN', 'ESP', 'GBR', 'AND', 'FIN', 'POL', 'CRO', 'ARG', 'CHN']
+NATION_WEIGHTS = np.array([12, 9, 11, 10, 9, 8, 5, 5, 4, 4, 4, 4, 3, 3, 1, 2, 3, 2, 2, 4], dtype=float)
+# Share of the active athletes with a position in each discipline
+RANKED_SHARE = {'DH': 0.30, 'SL': 0.75, 'GS': 0.80, 'SG': 0.35, 'AC': 0.20}
+
+
+def generate_athletes(n, first_listyear, last_listyear, rng):
+    """
+    Pool of ``n`` athletes old enough to appear in at least one list between the two listyears.
+    """
+    birthyear = rng.integers(first_listyear - 35, last_listyear - 14, size=n)
+    ids = rng.choice(np.arange(100000, 100000 + 10 * n), size=n, replace=False)
+    return pd.DataFrame({
+        'Competitorid': ids,
+        'Fiscode': ids + 400000,
+        'Lastname': [f"LAST{i}" for i in range(n)],
+        'Firstname': [f"First{i}" for i in range(n)],
+        'Nationcode': rng.choice(NATIONS, size=n, p=NATION_WEIGHTS / NATION_WEIGHTS.sum()),
+        'Gender': rng.choice(['M', 'W'], size=n, p=[0.58, 0.42]),
+        'Birthyear': birthyear,
+        'skill': rng.normal(0, 1, size=n),
+    })
+
+
+def generate_fis_list(athletes, listyear, listid, rng):
+    """
+    One points list for ``listyear`` with all columns of the FIS CSV, in the FIS column order.
+    """
+    age = listyear - athletes['Birthyear']
+    df = athletes[(age >= 15) & (age <= 35)].reset_index(drop=True)
+    n = len(df)
+    age = (listyear - df['Birthyear']).to_numpy()
+
+    data = {
+        'Listid': listid,
+        'Listname': f"FIS points list {listyear - 1}/{listyear}",
+        'listPublished': 1,
+        'Published': 1,
+        'Sectorcode': 'AL',
+        'Status': 'O',
+        'Competitorid': df['Competitorid'],
+        'Fiscode': df['Fiscode'],
+        'Lastname': df['Lastname'],
+        'Firstname': df['Firstname'],
+        'Nationcode': df['Nationcode'],
+        'Gender': df['Gender'],
+        'Birthdate': df['Birthyear'].astype(str) + "-01-01",
+        'Skiclub': None,
+        'Nationalcode': None,
+        'Competitorname': df['Lastname'] + " " + df['Firstname'],
+        'Birthyear': df['Birthyear'],
+        'Calculationdate': f"01-05-{listyear}",
+    }
+    # Athletes improve until their late twenties
+    form = df['skill'].to_numpy() + 0.15 * np.minimum(age - 15, 12)
+    for disciplin, share in RANKED_SHARE.items():
+        ranked = rng.random(n) < share
+        points = np.exp(5.5 - 0.6 * (form + rng.normal(0, 0.5, n))).round(2)
+        points = np.where(ranked, points, np.nan)
+        pos = pd.Series(points).groupby(df['Gender']).rank(method='min')
+        data[f'{disciplin}points'] = points
+        data[f'{disciplin}pos'] = pos.to_numpy()
+        data[f'{disciplin}Sta'] = np.where(ranked & (rng.random(n) < 0.2), '*', None)
+
+    fis_list = pd.DataFrame(data)
+    return fis_list[list(FIS_LIST_SCHEMA)]
+
+
+def next_fis_list(fis_list, listid, date, rng, changed=0.1):
+    """
+    The following list of the same season: the points of a ``changed`` share of the athletes move,
+    the positions are re-ranked and the list id, name and calculation date are replaced.
+    """
+    fis_list = fis_list.copy()
+    moved = rng.random(len(fis_list)) < changed
+    for disciplin in RANKED_SHARE:
+        points = fis_list[f'{disciplin}points'].to_numpy()
+        points = np.where(moved, (points * np.exp(rng.normal(0, 0.08, len(points)))).round(2), points)
+        fis_list[f'{disciplin}points'] = points
+        fis_list[f'{disciplin}pos'] = pd.Series(points).groupby(fis_list['Gender']).rank(method='min').to_numpy()
+    fis_list['Listid'] = listid
+    fis_list['Listname'] = f"{listid % 25 + 1}. " + fis_list['Listname'].str.split(". ", n=1).str[-1]
+    fis_list['Calculationdate'] = date.strftime("%d-%m-%Y")
+    return fis_list
+
+
+def generate_lists(seasons=16, scale=1, last_listyear=2025, seed=0, lists_per_season=1):
+    """
+    Yield (listyear, listid, list) for ``seasons`` consecutive seasons ending in ``last_listyear``.
+    ``scale`` multiplies the number of athletes per list (about 13k at scale 1). With
+    ``lists_per_season`` > 1 every season has that many lists two weeks apart, the last one
+    published on May 1 as before.
+    """
+    rng = np.random.default_rng(seed)
+    first_listyear = last_listyear - seasons + 1
+    # About 21 of the (seasons + 20) birthyears in the pool are active in a given season
+    pool = int(ATHLETES_PER_LIST * scale * (seasons + 20) / 21)
+    athletes = generate_athletes(pool, first_listyear, last_listyear, rng)
+    for i, listyear in enumerate(range(first_listyear, last_listyear + 1)):
+        listid = 100 + 25 * i
+        fis_list = generate_fis_list(athletes, listyear, listid, rng)
+        if lists_per_season > 1:
+            last_date = pd.Timestamp(year=listyear, month=5, day=1)
+            fis_list['Listname'] = "1. " + fis_list['Listname']
+            fis_list['Calculationdate'] = (last_date - pd.Timedelta(weeks=2 * (lists_per_season - 1))).strftime("%d-%m-%Y")
+        yield listyear, listid, fis_list
+        for k in range(1, lists_per_season):
+            date = last_date - pd.Timedelta(weeks=2 * (lists_per_season - 1 - k))
+            fis_list = next_fis_list(fis_list, listid + k, date, rng)
+            yield listyear, listid + k, fis_list
+
+
+def generate_history(seasons=16, scale=1, last_listyear=2025, seed=0):
+    """
+    Combined history (last list per season) as stored in the legacy pickle, FIS column names.
+    """
+    return pd.concat([fis_list for _, _, fis_list in generate_lists(seasons, scale, last_listyear, seed)],
+                     ignore_index=True)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write synthetic FIS points list CSV files.")
+    parser.add_argument("directory", help="Output directory")
+    parser.add_argument("--seasons", type=int, default=16)
+    parser.add_argument("--scale", type=float, default=1)
+    parser.add_argument("--last-listyear", type=int, default=2025)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--lists-per-season", type=int, default=1, help="Intra-season lists per season (at most 25)")
+    args = parser.parse_args()
+
+    os.makedirs(args.directory, exist_ok=True)
+    for listyear, listid, fis_list in generate_lists(args.seasons, args.scale, args.last_listyear, args.seed, args.lists_per_season):
+        path = os.path.join(args.directory, f"FIS-points-list-AL-{listyear}-{listid}.csv")
+        fis_list.to_csv(path, index=False)
+        print(f"Wrote {path} ({len(fis_list)} rows)")
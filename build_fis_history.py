@@ -0,0 +1,251 @@
+"""
+Incremental builder for the combined FIS history.
+
+Replaces update_FIS_listCombined.ipynb. Every FIS points list (FIS-points-list-AL-YYYY-NNN.csv),
+including the ~20 intra-season lists, is stored as its own files in the dataset and recorded in
+its list index (storage.ListIndex: listid -> season, date, ...). A manifest next to the dataset
+records the content hash of every ingested file, so a run only reads and writes the lists that
+are new or have changed. The pages keep working on the last list of every season.
+With --deltas every list after the first of a season is stored as the delta to the list before
+it (deltas.py), a fraction of the size of a full list. The choice is kept in the manifest and
+applies to later runs as well, until --no-deltas stores the lists ingested from then on in full.
+Precomputed series (analytics.py) of the previous data version are computed again at the end
+of a run, or only removed with --no-precompute.
+
+Usage:
+    python build_fis_history.py /path/to/Lists_FIS
+    python build_fis_history.py /path/to/Lists_FIS --store data/fis_list_combined --dry-run
+    python build_fis_history.py /path/to/Lists_FIS --deltas
+    python build_fis_history.py /path/to/Lists_FIS --no-deltas
+"""
+import argparse
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+
+import pandas as pd
+
+from analytics import ResultStore, precompute, results_directory
+from cube import update_cube
+from fis_schema import HISTORY_COLUMNS, read_fis_list
+from mapped import build_mapped
+from storage import ListIndex, dataset_version, listyear_from_listname, read_list, write_list
+
+FILE_PATTERN = re.compile(r"^FIS-points-list-AL-(\d{4})-(\d+)\.csv$")
+DEFAULT_STORE = os.path.join("data", "fis_list_combined")
+MANIFEST_NAME = "_manifest.json"
+
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def select_lists(directory):
+    """
+    Return {filename: (year, number)} of every FIS points list in ``directory``.
+    """
+    file_dict = {}
+    for file in os.listdir(directory):
+        match = FILE_PATTERN.match(file)
+        if match is not None:
+            file_dict[file] = (match.group(1), int(match.group(2)))
+    return file_dict
+
+
+def manifest_path(store):
+    return os.path.join(store, MANIFEST_NAME)
+
+
+def load_manifest(store):
+    path = manifest_path(store)
+    if os.path.exists(path):
+        with open(path) as f:
+            return json.load(f)
+    return {}
+
+
+def save_manifest(store, manifest):
+    """
+    Write the manifest atomically so an interrupted run never leaves a truncated file behind.
+    """
+    os.makedirs(store, exist_ok=True)
+    path = manifest_path(store)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def season_files(store):
+    """
+    The part-*.parquet files of a store built with one list per season (by convert_pickle, or by
+    this builder with a manifest with "years"), they are replaced by one file per list.
+    """
+    return glob.glob(os.path.join(store, "listyear=*", "gender=*", "part-*.parquet"))
+
+
+def plan_updates(directory, manifest):
+    """
+    Compare the lists in ``directory`` with the manifest.
+    Returns [(year, filename, number, sha256)] for every list that needs to be (re)ingested,
+    in publication order.
+    """
+    updates = []
+    for file, (year, number) in sorted(select_lists(directory).items(), key=lambda item: item[1]):
+        digest = file_hash(os.path.join(directory, file))
+        entry = manifest["lists"].get(file)
+        if entry is None or entry["sha256"] != digest:
+            updates.append((year, file, number, digest))
+    return updates
+
+
+def list_date(data):
+    """
+    Calculation date of a list as ISO date ("" if the list has none).
+    """
+    if 'calculationdate' not in data.columns or data['calculationdate'].isna().all():
+        return ""
+    date = pd.to_datetime(data['calculationdate'].dropna().iloc[0], format="%d-%m-%Y", errors='coerce')
+    return "" if pd.isna(date) else date.date().isoformat()
+
+
+def previous_list(index, listid, listyear, number):
+    """
+    Listid of the list a new list of the season is stored as delta to: the season's last list,
+    if it was published before it. None to store the list in full.
+    """
+    previous = index.last.get(listyear)
+    if previous is None or previous == listid or index.get(previous)['number'] > number:
+        return None
+    return previous
+
+
+def refresh_results(store, precompute_results=True, log=print):
+    """
+    The precomputed series (analytics.py) belong to one data version. If there are results of an
+    older version, compute them again for the current one (``precompute_results``) or remove
+    them; the pages compute every series live until results of the current version exist.
+    """
+    results = ResultStore(results_directory(store), dataset_version(store))
+    stale = results.other_versions()
+    if not stale:
+        return
+    if precompute_results:
+        log(f"Precomputed results are stale ({len(stale)} old version(s)), computing them again.")
+        precompute(store, log=log)
+    else:
+        results.remove_other_versions()
+        log(f"Removed {len(stale)} stale version(s) of the precomputed results, the series are computed "
+            "live until `python analytics.py` is run.")
+
+
+def build_history(directory, store=DEFAULT_STORE, dry_run=False, deltas=None, precompute_results=True, log=print):
+    """
+    Ingest new or changed FIS lists from ``directory`` into the dataset at ``store``.
+    Each ingested list replaces only its own files and list index entry. With ``deltas`` lists
+    after the first of a season are stored as delta to their predecessor (None: as the store
+    was built before).
+    Afterwards the cohort-ranking cube (cube.py) is updated for the seasons whose last list
+    changed, the memory-mapped prepared history (mapped.py) is rewritten and precomputed
+    results of the previous version are refreshed (see refresh_results).
+    Returns the list of ingested files.
+    """
+    manifest = load_manifest(store)
+    if "lists" not in manifest:
+        # No manifest or one of the season builder: old part files would duplicate the lists
+        old_files = season_files(store)
+        if old_files:
+            log(f"Store holds one list per season ({len(old_files)} files), ingesting all lists.")
+            if not dry_run:
+                for path in old_files:
+                    os.remove(path)
+        manifest = {"lists": {}}
+    if deltas is None:
+        deltas = manifest.get("deltas", False)
+    manifest["deltas"] = deltas
+    updates = plan_updates(directory, manifest)
+    if not updates:
+        log("History is up to date.")
+        return []
+
+    index = ListIndex.read(store) or ListIndex()
+    last_before = dict(index.last)
+    ingested = set()
+    for year, file, number, digest in updates:
+        if dry_run:
+            log(f"Would ingest {file} (year {year}, list {number})")
+            continue
+        start = time.perf_counter()
+        data = read_fis_list(os.path.join(directory, file), columns=HISTORY_COLUMNS + ["calculationdate"])
+        date = list_date(data)
+        data = data.drop(columns="calculationdate", errors="ignore")
+        listid = int(data['listid'].iloc[0])
+        listyear = int(listyear_from_listname(data['listname'].head(1)).iloc[0])
+        # Lists stored as delta to this one are stored in full before it changes
+        for entry in [row for row in index.by_id.values() if row['delta_of'] == listid]:
+            dependent = read_list(store, entry['listid']).astype({'gender': 'category'})  # as read_fis_list
+            write_list(dependent, store)
+            index = index.add(**{**entry, 'delta_of': 0})
+        previous = previous_list(index, listid, listyear, number) if deltas else None
+        write_list(data, store, read_list(store, previous) if previous else None)
+        index = index.add(listid, listyear, number, data['listname'].iloc[0], date, len(data), delta_of=previous or 0)
+        index.write(store)
+        ingested.add(listid)
+        manifest["lists"][file] = {
+            "year": year,
+            "number": number,
+            "listid": listid,
+            "sha256": digest,
+            "rows": int(len(data)),
+        }
+        # Save after every list so a failed run resumes where it stopped
+        save_manifest(store, manifest)
+        log(f"Ingested {file} (year {year}, list {number}, {len(data)} rows) in {time.perf_counter() - start:.2f}s")
+    if dry_run:
+        return [file for _, file, _, _ in updates]
+
+    # The pages and the cube work on the last list per season: its cube rows change if it is another
+    # list now or if it was ingested again (a corrected list keeps its listid)
+    listyears = {year for year, listid in index.last.items() if last_before.get(year) != listid or listid in ingested}
+    if listyears:
+        start = time.perf_counter()
+        update_cube(store, sorted(listyears))
+        log(f"Updated cohort cube for {len(listyears)} listyear(s) in {time.perf_counter() - start:.2f}s")
+    # Last, as the mapped layout is written for the version of the finished dataset
+    start = time.perf_counter()
+    build_mapped(store, log)
+    log(f"Wrote the memory-mapped history in {time.perf_counter() - start:.2f}s")
+    refresh_results(store, precompute_results, log)
+    return [file for _, file, _, _ in updates]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Incrementally build the combined FIS history from the FIS points list CSV files.")
+    parser.add_argument("directory", help="Directory containing FIS-points-list-AL-YYYY-NNN.csv files")
+    parser.add_argument("--store", default=DEFAULT_STORE, help=f"Output dataset directory (default: {DEFAULT_STORE})")
+    parser.add_argument("--dry-run", action="store_true", help="Only report which lists would be ingested")
+    parser.add_argument("--no-precompute", action="store_true",
+                        help="Remove stale precomputed results instead of computing them again")
+    parser.add_argument("--deltas", action=argparse.BooleanOptionalAction, default=None,
+                        help="Store the lists after the first of a season as deltas, or in full with --no-deltas "
+                             "(default: as the store was built before, in full for a new store)")
+    args = parser.parse_args(argv)
+
+    if not os.path.isdir(args.directory):
+        print(f"Source directory not found: {args.directory}", file=sys.stderr)
+        return 2
+    build_history(args.directory, args.store, dry_run=args.dry_run, deltas=args.deltas,
+                  precompute_results=not args.no_precompute)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
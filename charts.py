@@ -0,0 +1,90 @@
+"""
+Matplotlib charts of the birth-year pages as pure functions of their data.
+
+The figures are built on matplotlib.figure.Figure (no pyplot state), so they can be rendered
+from any thread or process and rasterized once into PNG bytes that the app caches.
+"""
+import io
+
+from matplotlib.figure import Figure
+
+COLOR_INT = '#0328fc'
+COLOR_SUI = '#4a0a13'
+
+
+def format_season_column(df, birthyear_col='birthyear'):
+    df = df.copy()
+    df['season'] = df['season'].astype(str).str[2:]
+    df['season'] = df['season'].astype(int).apply(lambda x: f"{x-1}/{x}")
+    df['season'] = "S" + df['season'].astype(str) + " BY" + df[birthyear_col].astype(str)
+    return df
+
+
+def _plot_means(ax, x, df, title):
+    ax.plot(x, df['meanint'], label='Int', marker='o', color=COLOR_INT)
+    ax.plot(x, df['meansui'], label='SUI', marker='o', color=COLOR_SUI)
+    ax.set_title(title)
+    ax.invert_yaxis()
+    ax.set_xlabel('Season')
+    ax.set_ylabel('Weltranglistenposition')
+    ax.legend()
+    ax.grid(True)
+
+    # Add value labels
+    for j in range(len(df)):
+        ax.annotate(f"{df['meanint'].iloc[j]:.2f}", (x[j], df['meanint'].iloc[j]),
+                    textcoords="offset points", xytext=(0, 10), ha='center', color=COLOR_INT)
+        ax.annotate(f"{df['meansui'].iloc[j]:.2f}", (x[j], df['meansui'].iloc[j]),
+                    textcoords="offset points", xytext=(0, 10), ha='center', color=COLOR_SUI)
+
+
+def birthyear_over_seasons_figure(df_results, disciplin):
+    """
+    "Year of birth over seasons": one subplot per top k, ``df_results`` is {top: collect_data result}.
+    """
+    fig = Figure(figsize=(8 * len(df_results), 6), dpi=300)
+    axes = fig.subplots(1, len(df_results), squeeze=False)[0]
+    for ax, (top, df) in zip(axes, df_results.items()):
+        df = format_season_column(df)
+        seasons = list(df['season'])
+        _plot_means(ax, seasons, df, 'Top ' + str(top) + ' ' + str(disciplin))
+        ax.set_xticks(seasons)  # Add tick for every year
+        ax.set_xticklabels(seasons, rotation=45)
+    return fig
+
+
+def development_over_seasons_figure(df_results, top):
+    """
+    "Year of birth Development over Seasons": 2x2 grid, ``df_results`` is {disciplin: collect_data_Entw result}.
+    """
+    fig = Figure(figsize=(24, 12), dpi=300)
+    axes = fig.subplots(2, 2)
+    fig.subplots_adjust(hspace=0.4)  # Add space between rows
+
+    for i, (disciplin, df) in enumerate(df_results.items()):
+        df = format_season_column(df)
+        # Create positional indices for categorical x-values
+        positions = list(range(len(df)))
+        ax = axes[i // 2, i % 2]
+        _plot_means(ax, positions, df, 'Top ' + str(top) + ' ' + str(disciplin))
+        ax.set_xticks(positions)  # Add tick for every season
+        ax.set_xticklabels(df['season'], rotation=45)
+
+        # Set x-axis maximum to the season that contains "S24/25"
+        if df['season'].str.contains("S24/25").any():
+            max_index = df.index[df['season'].str.contains("S24/25")][0]
+            ax.set_xlim(-0.5, max_index + 0.5)
+    return fig
+
+
+def figure_bytes(fig, fmt="png", dpi=200):
+    """
+    Render ``fig`` as ``fmt`` (png, pdf, svg) with the settings st.pyplot used (dpi 200, tight bounding box).
+    """
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format=fmt, dpi=dpi, bbox_inches="tight")
+    return buffer.getvalue()
+
+
+def figure_png(fig, dpi=200):
+    return figure_bytes(fig, "png", dpi)
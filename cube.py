@@ -0,0 +1,165 @@
+"""
+Materialized cohort-ranking cube.
+
+Every chart on the birth-year pages is a function of (gender, discipline, birthyear, listyear,
+nation group, k). This input space is small and only changes when a new list is ingested, so
+build_fis_history.py precomputes it into one compact table next to the dataset:
+
+    gender, disciplin, birthyear, listyear,
+    meanint_1 .. meanint_50, meansui_1 .. meansui_50,   # mean position of the top k (Int / SUI)
+    suitop_10 .. suitop_200                             # SUI athletes among the best N of the cohort
+
+The collect_data* functions in utils.py read from the cube through CohortIndex(..., cube=...)
+and fall back to live computation for cells that are not in it.
+"""
+import argparse
+import os
+
+import pandas as pd
+
+from prepare import prepare_combined_data
+from storage import read_history, touch_version
+from utils import cohorts_over_birthyears, nation_counts_by_cohort, topX_means_by_cohort
+
+CUBE_NAME = "_cohort_cube.parquet"
+CUBE_TOPS = list(range(1, 51))
+CUBE_THRESHOLDS = [10, 20, 30, 40, 50, 60, 70, 80, 90, 100, 150, 200]
+CUBE_DISCIPLINES = ['DH', 'SL', 'GS', 'SG', 'AC']
+CUBE_KEYS = ['gender', 'disciplin', 'birthyear', 'listyear']
+
+
+def cube_path(store):
+    return os.path.join(store, CUBE_NAME)
+
+
+def build_cube(combined_df, nation='SUI'):
+    """
+    Compute the cube rows for every (gender, birthyear, listyear) cohort in the prepared history.
+    """
+    frames = []
+    for gender, df_gender in combined_df.groupby('gender', observed=True):
+        for disciplin in CUBE_DISCIPLINES:
+            if f"{disciplin.lower()}pos" not in df_gender.columns:
+                continue
+            means = topX_means_by_cohort(df_gender, disciplin, CUBE_TOPS, nation)
+            means.columns = [f"{kind}_{top}" for kind, top in means.columns]
+            counts = nation_counts_by_cohort(df_gender, disciplin, CUBE_THRESHOLDS, nation)
+            counts.columns = [f"suitop_{top}" for top in counts.columns]
+
+            # Cohorts without any ranked athlete still get a row, so they are not recomputed live
+            cohorts = df_gender[['birthyear', 'listyear']].drop_duplicates().astype('int64')
+            cohort_index = pd.MultiIndex.from_frame(cohorts)
+            df = pd.concat([means.reindex(cohort_index), counts.reindex(cohort_index).fillna(0)], axis=1)
+            df = df.reset_index()
+            df.insert(0, 'disciplin', disciplin)
+            df.insert(0, 'gender', str(gender))
+            frames.append(df)
+
+    cube = pd.concat(frames, ignore_index=True)
+    cube[['birthyear', 'listyear']] = cube[['birthyear', 'listyear']].astype('int16')
+    for col in cube.columns:
+        if col.startswith('mean'):
+            cube[col] = cube[col].astype('float32')
+        elif col.startswith('suitop_'):
+            cube[col] = cube[col].astype('int16')
+    return cube
+
+
+def read_cube(store):
+    path = cube_path(store)
+    if not os.path.exists(path):
+        return None
+    return pd.read_parquet(path)
+
+
+def write_cube(cube, store):
+    path = cube_path(store)
+    tmp_path = path + ".tmp"
+    cube.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+    touch_version(store)
+
+
+def update_cube(store, listyears=None):
+    """
+    Recompute the cube rows of ``listyears`` (all years if None) from the dataset at ``store``
+    and replace them in the stored cube.
+    """
+    cube = read_cube(store)
+    if cube is None:
+        listyears = None
+    combined_df = read_history(store, listyears=listyears)
+    cube_new = build_cube(prepare_combined_data(combined_df))
+    if cube is not None and listyears is not None:
+        cube = cube[~cube['listyear'].isin(listyears)]
+        cube_new = pd.concat([cube, cube_new], ignore_index=True)
+    write_cube(cube_new, store)
+    return cube_new
+
+
+class CohortCube:
+    """
+    Lookup of precomputed cube cells by (gender, disciplin, birthyear, listyear).
+    """
+
+    def __init__(self, cube):
+        self.table = cube.set_index(CUBE_KEYS).sort_index()
+        self.listyears = set(cube['listyear'].astype(int))
+
+    def _rows(self, Gender, disciplin, cohorts):
+        keys = pd.MultiIndex.from_tuples([(Gender, disciplin, birthyear, season) for birthyear, season in cohorts], names=CUBE_KEYS)
+        return self.table.reindex(keys)
+
+    def _covered(self, cohorts):
+        # A cohort that is not in the cube is empty if its listyear was cubed, unknown otherwise
+        return [cohort for cohort in cohorts if cohort[1] in self.listyears]
+
+    def mean_topX(self, Gender, disciplin, cohorts, tops):
+        """
+        Long table (as utils.mean_topX) of the cubed cells and the list of cohorts that
+        have to be computed live.
+        """
+        if disciplin not in CUBE_DISCIPLINES or not all(top in CUBE_TOPS for top in tops):
+            return pd.DataFrame(), cohorts
+        covered = self._covered(cohorts)
+        missing = [cohort for cohort in cohorts if cohort not in covered]
+        rows = self._rows(Gender, disciplin, covered)
+        found = [
+            pd.DataFrame({
+                'birthyear': rows.index.get_level_values('birthyear'),
+                'season': rows.index.get_level_values('listyear'),
+                'disciplin': disciplin,
+                'top': top,
+                'meanint': rows[f'meanint_{top}'].astype('float64').to_numpy(),
+                'meansui': rows[f'meansui_{top}'].astype('float64').to_numpy(),
+            })
+            for top in tops
+        ]
+        return pd.concat(found, ignore_index=True), missing
+
+    def collect_data_No(self, birthyear, FISYear, Gender, disciplin, thresholds):
+        """
+        utils.collect_data_No from the cube, or None if any cell is not cubed.
+        """
+        cohorts = cohorts_over_birthyears(birthyear, FISYear)
+        if disciplin not in CUBE_DISCIPLINES or not all(top in CUBE_THRESHOLDS for top in thresholds):
+            return None
+        if len(self._covered(cohorts)) < len(cohorts):
+            return None
+        rows = self._rows(Gender, disciplin, cohorts)
+        df = pd.DataFrame({
+            'birthyear': [cohort[0] for cohort in cohorts],
+            'season': [cohort[1] for cohort in cohorts],
+        })
+        for top in thresholds:
+            df[f'top{top}'] = rows[f'suitop_{top}'].fillna(0).astype(int).to_numpy()
+        return df
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="(Re)build the cohort-ranking cube of the combined FIS history.")
+    parser.add_argument("store", nargs="?", default=os.path.join("data", "fis_list_combined"), help="Dataset directory")
+    args = parser.parse_args()
+
+    cube = update_cube(args.store)
+    print(f"Wrote {len(cube)} cube rows to {cube_path(args.store)}")
@@ -0,0 +1,146 @@
+"""
+Delta encoding of consecutive FIS points lists.
+
+Two consecutive lists of a season differ for a fraction of the ~13k athletes only. A delta holds
+the athletes of the new list that changed against the previous one, one row per athlete with a
+``change`` column:
+
+    added     athlete new in the list (or with changed name, nation, ...): the full row
+    changed   points changed: competitorid, gender and the points columns
+    removed   athlete no longer in the list: competitorid and gender
+    position  position that is not the rank of the points: competitorid, gender, position columns
+
+Positions are not stored: a single athlete moving shifts the position of everyone between its
+old and new rank. In the FIS lists a position is the rank (method 'min') of the points within
+the gender, so it is derived again when a list is rebuilt; ``position`` rows keep exceptions.
+
+storage.write_list stores a season's first list in full and every following list as the delta
+to its predecessor; apply_deltas rebuilds a list from the full list and the chain of deltas.
+"""
+import numpy as np
+import pandas as pd
+
+KEY = 'competitorid'
+# Constant per list, kept in the list index (storage.ListIndex) instead of the rows
+LIST_COLUMNS = ['listid', 'listname', 'listyear']
+
+
+def value_columns(columns):
+    return [col for col in columns if col.endswith('points')]
+
+
+def position_columns(columns):
+    return [col for col in columns if col.endswith('pos') and col[:-3] + 'points' in columns]
+
+
+def identity_columns(columns):
+    other = set(value_columns(columns)) | set(position_columns(columns)) | set(LIST_COLUMNS)
+    return [col for col in columns if col not in other]
+
+
+def derive_positions(df, positions):
+    """
+    The ``positions`` columns (e.g. dhpos) as the rank of the points of ``df`` within the gender.
+    """
+    grouped = df.groupby('gender', observed=True, sort=False)
+    return pd.DataFrame({col: grouped[col[:-3] + 'points'].rank(method='min') for col in positions}, index=df.index)
+
+
+def _differs(a, b):
+    """
+    Element-wise a != b where two missing values are equal.
+    """
+    a, b = a.to_numpy(dtype=object), b.to_numpy(dtype=object)
+    a = np.where(pd.isna(a), None, a)
+    b = np.where(pd.isna(b), None, b)
+    return ~(a == b).astype(bool)
+
+
+def _delta_dtype(dtype):
+    """
+    Column type in a delta, where the columns an athlete's change does not touch are missing:
+    nullable integers, categories as strings, so every delta of a list has the same schema.
+    """
+    if isinstance(dtype, pd.CategoricalDtype):
+        return pd.StringDtype()
+    if pd.api.types.is_integer_dtype(dtype) and not isinstance(dtype, pd.api.extensions.ExtensionDtype):
+        return pd.api.types.pandas_dtype(dtype.name.capitalize())
+    return dtype
+
+
+def list_delta(previous, current):
+    """
+    Delta that turns the list ``previous`` into ``current`` (both with one row per competitorid).
+    """
+    columns = [col for col in current.columns if col not in LIST_COLUMNS]
+    values, positions, identity = value_columns(columns), position_columns(columns), identity_columns(columns)
+    prev = previous.set_index(KEY)
+    cur = current.set_index(KEY)
+
+    common = cur.index.intersection(prev.index)
+    prev_common, cur_common = prev.loc[common], cur.loc[common]
+    identity_changed = np.zeros(len(common), dtype=bool)
+    for col in identity:
+        if col != KEY:
+            identity_changed |= _differs(prev_common[col], cur_common[col])
+    values_changed = np.zeros(len(common), dtype=bool)
+    for col in values:
+        values_changed |= _differs(prev_common[col], cur_common[col])
+
+    derived = derive_positions(cur, positions)
+    position_differs = np.zeros(len(cur), dtype=bool)
+    for col in positions:
+        position_differs |= _differs(cur[col], derived[col])
+
+    added = cur.loc[cur.index.difference(prev.index).union(common[identity_changed])]
+    changed = cur_common.loc[values_changed & ~identity_changed, ['gender'] + values]
+    removed = prev.loc[prev.index.difference(cur.index), ['gender']]
+    exceptions = cur.loc[position_differs, ['gender'] + positions]
+    dtypes = {col: _delta_dtype(cur[col].dtype) for col in columns if col != KEY} | {'change': pd.StringDtype()}
+    parts = [part.assign(change=change).reindex(columns=list(dtypes)).astype(dtypes) for part, change in
+             ((added, 'added'), (changed, 'changed'), (removed, 'removed'), (exceptions, 'position'))]
+    delta = pd.concat([part for part in parts if len(part)] or parts[:1])
+    return delta.rename_axis(KEY).reset_index()
+
+
+def _latest(base, deltas, changes, columns):
+    """
+    Last row per athlete of ``columns`` from the base list and the ``changes`` rows of the deltas.
+    """
+    frames = [delta.loc[delta['change'].isin(changes), columns] for delta in deltas]
+    frames = [base[columns]] + [frame for frame in frames if len(frame)]
+    return pd.concat(frames, ignore_index=True).drop_duplicates(KEY, keep='last').set_index(KEY)
+
+
+def apply_deltas(base, deltas):
+    """
+    List reached from the full list ``base`` by applying ``deltas`` in order, sorted by competitorid.
+    Only the athlete columns are rebuilt, the list columns (listid, listname, listyear) are not set.
+    """
+    columns = [col for col in base.columns if col not in LIST_COLUMNS]
+    if not deltas:
+        return base[columns].sort_values(KEY, kind='stable').reset_index(drop=True)
+    values, positions, identity = value_columns(columns), position_columns(columns), identity_columns(columns)
+
+    # The last event of an athlete decides whether it is in the list, the last added row gives its
+    # name, nation, ... and the last added or changed row its points
+    last = _latest(base.assign(change='added'), deltas, ['added', 'changed', 'removed'], [KEY, 'change'])
+    ids = np.sort(last.index[last['change'] != 'removed'].to_numpy(dtype='int64'))
+    rows = _latest(base, deltas, ['added'], identity)
+    points = _latest(base, deltas, ['added', 'changed'], [KEY] + values)
+    result = rows.loc[ids, [col for col in identity if col != KEY]].join(points.loc[ids, values])
+
+    # Positions of the rebuilt list, with the exceptions stored in its own delta
+    result = result.join(derive_positions(result, positions))
+    exceptions = deltas[-1]
+    exceptions = exceptions[exceptions['change'] == 'position'].set_index(KEY)[positions]
+    if len(exceptions):
+        result.loc[exceptions.index, positions] = exceptions
+
+    result = result.rename_axis(KEY).reset_index()[columns]
+    for col in columns:
+        if isinstance(base[col].dtype, pd.CategoricalDtype):
+            result[col] = result[col].astype('category')
+        elif result[col].dtype != base[col].dtype:
+            result[col] = result[col].astype(base[col].dtype)
+    return result
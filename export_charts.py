@@ -0,0 +1,190 @@
+"""
+Batch export of the "Year of birth over seasons" and "Year of birth Development over Seasons"
+charts for a matrix of birthyears, genders, disciplines, FIS years and top X values.
+
+The charts are rendered in parallel worker processes, each with its own Analytics (so
+precomputed series from `python analytics.py` are used). Output is one file per chart in a
+directory, or a multi-page PDF. A manifest in the output directory records a hash of every
+chart's data, so charts whose data has not changed since the last run are not rendered again.
+
+Usage:
+    python export_charts.py exports/                          # PNG per chart, 1994-2011, M/W
+    python export_charts.py exports/ --format pdf --fis-years 1 2 3
+    python export_charts.py coaches_pack.pdf --tops 10 20 --workers 4
+"""
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+from matplotlib.image import imread
+
+from analytics import BIRTHYEARS, DEFAULT_STORE, DEVELOPMENT_DISCIPLINES, GENDERS, Analytics
+from charts import birthyear_over_seasons_figure, development_over_seasons_figure, figure_bytes
+
+MANIFEST_NAME = "_export_manifest.json"
+PDF_PAGES_KEY = "_pdf_pages"  # manifest entry: page names of the last written PDF
+
+
+def chart_jobs(birthyears=BIRTHYEARS, genders=GENDERS, disciplines=DEVELOPMENT_DISCIPLINES, fis_years=(1,), tops=(10,)):
+    """
+    (kind, params, name) of every chart in the matrix, in page order.
+    """
+    jobs = []
+    for Gender in genders:
+        for birthyear in birthyears:
+            for FISYear in fis_years:
+                for disciplin in disciplines:
+                    jobs.append(('birthyear_over_seasons', (birthyear, FISYear, Gender, disciplin),
+                                 f"birthyear_over_seasons_{Gender}_{birthyear}_FY{FISYear}_{disciplin}"))
+                for top in tops:
+                    jobs.append(('development_over_seasons', (birthyear, FISYear, Gender, top),
+                                 f"development_over_seasons_{Gender}_{birthyear}_FY{FISYear}_top{top}"))
+    return jobs
+
+
+def chart_data(analytics, kind, params, dpi=None):
+    """
+    Series of one chart and a hash of them and of the resolution, which changes only if the
+    chart would change.
+    """
+    if kind == 'birthyear_over_seasons':
+        df_results = analytics.birthyear_over_seasons(*params)
+    else:
+        df_results = analytics.development_over_seasons(*params)
+    h = hashlib.sha256(repr((kind, params, dpi)).encode())
+    for key, df in df_results.items():
+        h.update(str(key).encode())
+        h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return df_results, h.hexdigest()
+
+
+def chart_figure(kind, params, df_results):
+    if kind == 'birthyear_over_seasons':
+        return birthyear_over_seasons_figure(df_results, params[3])
+    return development_over_seasons_figure(df_results, params[3])
+
+
+_worker = None
+
+
+def _init_worker(store, pickle_path, results_dir):
+    global _worker
+    _worker = Analytics(store, pickle_path=pickle_path, results_dir=results_dir)
+
+
+def _export_chart(kind, params, path, fmt, dpi, previous_hash):
+    """
+    Render one chart to ``path`` unless its data hash equals ``previous_hash`` and the file exists.
+    Returns (path, hash, rendered).
+    """
+    df_results, data_hash = chart_data(_worker, kind, params, dpi)
+    if data_hash == previous_hash and os.path.exists(path):
+        return path, data_hash, False
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(figure_bytes(chart_figure(kind, params, df_results), fmt, dpi))
+    os.replace(tmp_path, path)
+    return path, data_hash, True
+
+
+def load_manifest(directory):
+    path = os.path.join(directory, MANIFEST_NAME)
+    if os.path.exists(path):
+        with open(path) as f:
+            return json.load(f)
+    return {}
+
+
+def save_manifest(directory, manifest):
+    path = os.path.join(directory, MANIFEST_NAME)
+    with open(path + ".tmp", 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(path + ".tmp", path)
+
+
+def write_pdf(pdf_path, pages):
+    """
+    Multi-page PDF with one rendered PNG per page and its name as page header.
+    """
+    with PdfPages(pdf_path + ".tmp") as pdf:
+        for name, png_path in pages:
+            image = imread(png_path)
+            height, width = image.shape[:2]
+            fig = Figure(figsize=(width / 100, height / 100 + 0.5), dpi=100)
+            fig.figimage(image, xo=0, yo=0)
+            fig.text(0.01, 1 - 0.25 / (height / 100 + 0.5), name, va='center', fontsize=12)
+            pdf.savefig(fig)
+    os.replace(pdf_path + ".tmp", pdf_path)
+
+
+def export_charts(output, jobs, store=DEFAULT_STORE, pickle_path=None, results_dir=None,
+                  fmt="png", dpi=200, workers=None, log=print):
+    """
+    Export ``jobs`` (see chart_jobs) to the directory ``output`` or, if it ends in .pdf, into one
+    multi-page PDF (pages rendered as PNG into ``<output>.pages/``). Returns (rendered, skipped).
+    """
+    pdf_path = output if output.lower().endswith(".pdf") else None
+    directory = pdf_path + ".pages" if pdf_path else output
+    if pdf_path:
+        fmt = "png"
+    os.makedirs(directory, exist_ok=True)
+    manifest = load_manifest(directory)
+
+    rendered = skipped = 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(store, pickle_path, results_dir)) as pool:
+        futures = {}
+        for kind, params, name in jobs:
+            path = os.path.join(directory, f"{name}.{fmt}")
+            previous_hash = manifest.get(os.path.basename(path))
+            futures[pool.submit(_export_chart, kind, params, path, fmt, dpi, previous_hash)] = name
+        for done, future in enumerate(as_completed(futures), 1):
+            path, data_hash, was_rendered = future.result()
+            manifest[os.path.basename(path)] = data_hash
+            rendered += was_rendered
+            skipped += not was_rendered
+            log(f"[{done}/{len(futures)}] {time.perf_counter() - start:6.1f}s "
+                f"{'rendered ' if was_rendered else 'unchanged'} {futures[future]}")
+    save_manifest(directory, manifest)
+
+    if pdf_path:
+        # Also rebuilt when only the selection of (unchanged) charts differs from the last PDF
+        names = [name for _, _, name in jobs]
+        if rendered or not os.path.exists(pdf_path) or manifest.get(PDF_PAGES_KEY) != names:
+            write_pdf(pdf_path, [(name, os.path.join(directory, f"{name}.png")) for name in names])
+            manifest[PDF_PAGES_KEY] = names
+            save_manifest(directory, manifest)
+            log(f"Wrote {pdf_path} ({len(jobs)} pages)")
+    return rendered, skipped
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Export the birth-year charts for all parameter combinations.")
+    parser.add_argument("output", help="Output directory, or a .pdf file for one multi-page PDF")
+    parser.add_argument("--format", choices=["png", "pdf", "svg"], default="png", help="File format in directory mode")
+    parser.add_argument("--birthyears", type=int, nargs=2, default=[BIRTHYEARS[0], BIRTHYEARS[-1]], metavar=("FROM", "TO"))
+    parser.add_argument("--genders", nargs="+", default=GENDERS, choices=GENDERS)
+    parser.add_argument("--disciplines", nargs="+", default=DEVELOPMENT_DISCIPLINES, help="Disciplines of the 'over seasons' charts")
+    parser.add_argument("--fis-years", type=int, nargs="+", default=[1])
+    parser.add_argument("--tops", type=int, nargs="+", default=[10], help="Top X of the development charts")
+    parser.add_argument("--dpi", type=int, default=200)
+    parser.add_argument("--workers", type=int, help="Worker processes (default: number of CPUs)")
+    parser.add_argument("--store", default=DEFAULT_STORE, help="Dataset directory")
+    parser.add_argument("--pickle", help="Legacy combined pickle, used if the dataset does not exist")
+    parser.add_argument("--results", help="Precomputed results directory of analytics.py")
+    args = parser.parse_args()
+
+    if Analytics(args.store, pickle_path=args.pickle).version is None:
+        sys.exit(f"FIS history not found at {args.store}")
+    jobs = chart_jobs(range(args.birthyears[0], args.birthyears[1] + 1), args.genders, args.disciplines, args.fis_years, args.tops)
+    rendered, skipped = export_charts(args.output, jobs, args.store, args.pickle, args.results,
+                                      args.format, args.dpi, args.workers)
+    print(f"{rendered} charts rendered, {skipped} unchanged")
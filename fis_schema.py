@@ -0,0 +1,122 @@
+"""
+Schema of the FIS alpine points list CSV (FIS-points-list-AL-YYYY-NNN.csv) and a shared loader.
+
+Declaring the dtypes up front saves pandas from inferring all 33 columns, ``usecols`` skips the
+columns we never look at, and low-cardinality text columns are loaded as categoricals.
+Used by the dashboard (app.py) and by the history builder (build_fis_history.py).
+"""
+import csv
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:  # pyarrow is optional here, the C engine of pandas is used instead
+    pa = None
+    pa_csv = None
+
+
+# Header name as published by FIS -> pandas dtype. Integers are nullable: older lists have blanks
+FIS_LIST_SCHEMA = {
+    "Listid": "Int32",
+    "Listname": "category",
+    "listPublished": "Int8",
+    "Published": "Int8",
+    "Sectorcode": "category",
+    "Status": "category",
+    "Competitorid": "Int64",
+    "Fiscode": "Int64",
+    "Lastname": str,
+    "Firstname": str,
+    "Nationcode": "category",
+    "Gender": "category",
+    "Birthdate": str,
+    "Skiclub": str,
+    "Nationalcode": str,
+    "Competitorname": str,
+    "Birthyear": "Int32",
+    "Calculationdate": str,
+    "DHpoints": "float64",
+    "DHpos": "float64",
+    "DHSta": "category",
+    "SLpoints": "float64",
+    "SLpos": "float64",
+    "SLSta": "category",
+    "GSpoints": "float64",
+    "GSpos": "float64",
+    "GSSta": "category",
+    "SGpoints": "float64",
+    "SGpos": "float64",
+    "SGSta": "category",
+    "ACpoints": "float64",
+    "ACpos": "float64",
+    "ACSta": "category",
+}
+
+DISCIPLINES = ["dh", "sl", "gs", "sg"]
+
+# Columns (lower-case) used by the pages working on the latest list
+LATEST_LIST_COLUMNS = (
+    ["competitorid", "competitorname", "nationcode", "gender", "birthyear"]
+    + [f"{d}{kind}" for d in DISCIPLINES for kind in ("points", "pos")]
+)
+
+# Columns (lower-case) kept in the combined history
+HISTORY_COLUMNS = (
+    ["listid", "listname", "competitorid", "fiscode", "competitorname", "nationcode", "gender", "birthyear"]
+    + [f"{d}{kind}" for d in DISCIPLINES + ["ac"] for kind in ("points", "pos")]
+)
+
+_SCHEMA_LOWER = {name.lower(): dtype for name, dtype in FIS_LIST_SCHEMA.items()}
+
+
+def default_engine():
+    return "pyarrow" if pa_csv is not None else "c"
+
+
+def _read_header(path):
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        return next(csv.reader(f))
+
+
+def _arrow_type(dtype):
+    if dtype == "category":
+        return pa.dictionary(pa.int32(), pa.string())
+    if dtype is str:
+        return pa.string()
+    dtype = pd.api.types.pandas_dtype(dtype)
+    return pa.from_numpy_dtype(getattr(dtype, 'numpy_dtype', dtype))
+
+
+# Arrow integers as the nullable pandas dtypes of the schema, as the C engine returns them
+_NULLABLE_INTEGERS = {pa.int8(): pd.Int8Dtype(), pa.int32(): pd.Int32Dtype(), pa.int64(): pd.Int64Dtype()} if pa else {}
+
+
+def read_fis_list(path, columns=None, engine=None):
+    """
+    Read a FIS points list CSV with explicit dtypes.
+    ``columns`` are lower-case column names to keep (None keeps all), the returned frame has
+    lower-case column names. ``engine`` is "pyarrow" (multithreaded, default if installed) or "c".
+    """
+    header = _read_header(path)
+    if columns is not None:
+        wanted = {col.lower() for col in columns}
+        header = [name for name in header if name.lower() in wanted]
+    dtypes = {name: _SCHEMA_LOWER[name.lower()] for name in header if name.lower() in _SCHEMA_LOWER}
+
+    engine = engine or default_engine()
+    if engine == "pyarrow":
+        table = pa_csv.read_csv(
+            path,
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=header,
+                column_types={name: _arrow_type(dtype) for name, dtype in dtypes.items()},
+            ),
+        )
+        data = table.to_pandas(types_mapper=_NULLABLE_INTEGERS.get)
+    else:
+        data = pd.read_csv(path, usecols=header, dtype=dtypes, engine=engine)
+
+    data.columns = map(str.lower, data.columns)
+    return data
@@ -0,0 +1,140 @@
+"""
+Opt-in performance instrumentation of the dashboard.
+
+Enabled with the environment variable FIS_DASHBOARD_INSTRUMENT=1, otherwise every call is a
+no-op. Records the wall time of named stages, cache hits and misses of the data loads, the
+memory of loaded DataFrames and the process RSS in rolling windows. The hidden diagnostics
+page of app.py (?diagnostics) shows their percentiles.
+"""
+import os
+import resource
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager, nullcontext
+
+import numpy as np
+import pandas as pd
+
+ENABLED = os.environ.get("FIS_DASHBOARD_INSTRUMENT", "") not in ("", "0")
+WINDOW = 500  # Measurements kept per stage
+PERCENTILES = (50, 90, 99)
+
+_lock = threading.Lock()
+_timings = defaultdict(lambda: deque(maxlen=WINDOW))
+_cache = defaultdict(lambda: {'hits': 0, 'misses': 0})
+_memory = {}
+_rss = deque(maxlen=WINDOW)
+
+
+def record(name, seconds):
+    if ENABLED:
+        with _lock:
+            _timings[name].append(seconds)
+
+
+@contextmanager
+def _stage(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, time.perf_counter() - start)
+
+
+def stage(name):
+    """
+    Context manager recording the wall time of the block as stage ``name``.
+    """
+    return _stage(name) if ENABLED else nullcontext()
+
+
+def record_cache(name, hit):
+    if ENABLED:
+        with _lock:
+            _cache[name]['hits' if hit else 'misses'] += 1
+
+
+def record_memory(name, obj):
+    """
+    Deep memory of a loaded DataFrame (or of the ``frame`` of an index built on one).
+    """
+    if not ENABLED:
+        return
+    df = getattr(obj, 'frame', obj)
+    if isinstance(df, pd.DataFrame):
+        with _lock:
+            _memory[name] = (len(df), int(df.memory_usage(deep=True).sum()))
+
+
+def rss_bytes():
+    """
+    Current resident set size of the process (peak RSS where /proc is not available).
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+
+def sample_rss():
+    if ENABLED:
+        with _lock:
+            _rss.append(rss_bytes())
+
+
+def _percentiles(values, scale=1.0):
+    values = np.asarray(values, dtype=float) * scale
+    row = {'count': len(values)}
+    row.update({f'p{p}': np.percentile(values, p) for p in PERCENTILES})
+    row['max'] = values.max()
+    return row
+
+
+def timings_summary():
+    """
+    Rolling percentiles of every stage in milliseconds, slowest p90 first.
+    """
+    with _lock:
+        timings = {name: list(values) for name, values in _timings.items() if values}
+    if not timings:
+        return pd.DataFrame()
+    df = pd.DataFrame({name: _percentiles(values, 1000) for name, values in timings.items()}).T
+    return df.sort_values(f'p{PERCENTILES[1]}', ascending=False)
+
+
+def cache_summary():
+    with _lock:
+        df = pd.DataFrame(dict(_cache)).T
+    if df.empty:
+        return df
+    df['hit rate'] = df['hits'] / (df['hits'] + df['misses'])
+    return df
+
+
+def memory_summary():
+    with _lock:
+        memory = dict(_memory)
+    df = pd.DataFrame(memory, index=['rows', 'bytes']).T
+    if not df.empty:
+        df['MB'] = df['bytes'] / 1e6
+    return df
+
+
+def rss_summary():
+    with _lock:
+        rss = list(_rss)
+    if not rss:
+        return pd.DataFrame()
+    return pd.DataFrame({'RSS MB': _percentiles(rss, 1e-6)}).T
+
+
+def reset():
+    with _lock:
+        _timings.clear()
+        _cache.clear()
+        _memory.clear()
+        _rss.clear()
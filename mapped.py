@@ -0,0 +1,143 @@
+"""
+Memory-mapped layout of the prepared FIS history.
+
+Every Streamlit server process used to load the Parquet dataset and run prepare.py on it, so
+each one held its own copy of the history. The prepared history is instead written once per
+data version as one .npy file per column next to the dataset:
+
+    data/fis_list_combined_mapped/<version>/_meta.json
+    data/fis_list_combined_mapped/<version>/dhpos.npy, dhpos.mask.npy, nationcode.npy, ...
+
+Numeric columns are stored as fixed-width arrays (nullable integers with a separate mask),
+strings and categoricals as integer codes with their categories in _meta.json. Rows are sorted
+by (gender, birthyear, listyear), so a gender is a contiguous row range and CohortIndex does not
+need to re-sort. open_mapped maps the files read-only with np.load(mmap_mode='r'), so all
+processes share the pages of the OS page cache and opening needs no deserialization.
+
+Usage:
+    python mapped.py --store data/fis_list_combined      # after build_fis_history.py
+"""
+import argparse
+import json
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from prepare import prepare_combined_data
+from storage import dataset_version, read_history
+
+META_NAME = "_meta.json"
+SORT_KEYS = ['gender', 'birthyear', 'listyear']  # CohortIndex.KEYS
+
+
+def mapped_root(store):
+    return os.path.join(os.path.dirname(os.path.abspath(store)), os.path.basename(os.path.normpath(store)) + "_mapped")
+
+
+def _encode(series):
+    """
+    ({file suffix: array}, column meta) of one column.
+    """
+    dtype = series.dtype
+    if isinstance(dtype, pd.CategoricalDtype) or not (pd.api.types.is_numeric_dtype(dtype) or pd.api.types.is_bool_dtype(dtype)):
+        values = series if isinstance(dtype, pd.CategoricalDtype) else series.astype('category')
+        return ({"": values.cat.codes.to_numpy()},
+                {"kind": "category", "categories": values.cat.categories.tolist(), "ordered": bool(values.cat.ordered)})
+    if isinstance(dtype, pd.api.extensions.ExtensionDtype):
+        array = series.array
+        return {"": array._data, ".mask": array._mask}, {"kind": "masked", "dtype": dtype.name}
+    return {"": series.to_numpy()}, {"kind": "numeric"}
+
+
+def write_mapped(prepared_df, store, version):
+    """
+    Write the prepared history as the mapped layout of ``version`` and remove older versions.
+    The layout is written into a temporary directory and renamed, so readers never see a partial one.
+    """
+    root = mapped_root(store)
+    path = os.path.join(root, str(version))
+    tmp_path = path + ".tmp"
+    shutil.rmtree(tmp_path, ignore_errors=True)
+    os.makedirs(tmp_path)
+
+    df = prepared_df.sort_values(SORT_KEYS, kind='stable').reset_index(drop=True)
+    genders = df['gender'].astype(str).to_numpy()
+    starts = np.flatnonzero(np.r_[True, genders[1:] != genders[:-1]]) if len(df) else np.array([], dtype=int)
+    stops = np.r_[starts[1:], len(df)]
+    meta = {
+        "version": version,
+        "rows": len(df),
+        "genders": {genders[start]: [int(start), int(stop)] for start, stop in zip(starts, stops)},
+        "columns": {},
+    }
+    for col in df.columns:
+        arrays, meta["columns"][col] = _encode(df[col])
+        for suffix, values in arrays.items():
+            np.save(os.path.join(tmp_path, f"{col}{suffix}.npy"), np.ascontiguousarray(values))
+    with open(os.path.join(tmp_path, META_NAME), 'w') as f:
+        json.dump(meta, f)
+
+    shutil.rmtree(path, ignore_errors=True)
+    os.rename(tmp_path, path)
+    # Processes that still have an old version mapped keep reading it until they reload
+    for entry in os.listdir(root):
+        if entry != str(version):
+            shutil.rmtree(os.path.join(root, entry), ignore_errors=True)
+    return path
+
+
+def _decode(path, col, meta, rows):
+    values = np.load(os.path.join(path, f"{col}.npy"), mmap_mode='r')[rows]
+    if meta["kind"] == "category":
+        dtype = pd.CategoricalDtype(meta["categories"], ordered=meta["ordered"])
+        return pd.Categorical.from_codes(values, dtype=dtype, validate=False)
+    if meta["kind"] == "masked":
+        mask = np.load(os.path.join(path, f"{col}.mask.npy"), mmap_mode='r')[rows]
+        return pd.api.types.pandas_dtype(meta["dtype"]).construct_array_type()(values, mask)
+    return values
+
+
+def open_mapped(store, version, columns=None, gender=None):
+    """
+    Prepared history of ``version`` from the mapped layout, or None if it was not written for this
+    version. ``columns`` selects history columns like Analytics.prepared (the derived
+    fisyearathlete and athleteage are always included); ``gender`` selects its row range.
+    The columns are read-only views of the mapped files, nothing is copied.
+    """
+    path = os.path.join(mapped_root(store), str(version))
+    try:
+        with open(os.path.join(path, META_NAME)) as f:
+            meta = json.load(f)
+    except OSError:
+        return None
+    if gender is None:
+        rows = slice(0, meta["rows"])
+    else:
+        rows = slice(*meta["genders"].get(gender, (0, 0)))
+    names = list(meta["columns"])
+    if columns is not None:
+        wanted = set(columns) | {'fisyearathlete', 'athleteage'}
+        names = [col for col in names if col in wanted]
+    return pd.DataFrame({col: _decode(path, col, meta["columns"][col], rows) for col in names}, copy=False)
+
+
+def build_mapped(store, log=print):
+    """
+    Prepare the history at ``store`` and write it as the mapped layout of its current version.
+    """
+    version = dataset_version(store)
+    if version is None:
+        raise FileNotFoundError(f"FIS history not found at {store}")
+    prepared = prepare_combined_data(read_history(store))
+    path = write_mapped(prepared, store, version)
+    log(f"Wrote {len(prepared)} rows x {len(prepared.columns)} columns to {path}")
+    return path
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write the prepared FIS history as memory-mapped column files.")
+    parser.add_argument("--store", default=os.path.join("data", "fis_list_combined"), help="Dataset directory")
+    args = parser.parse_args()
+    build_mapped(args.store)
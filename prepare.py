@@ -0,0 +1,110 @@
+"""
+Prepared-dataset stage for the combined FIS history.
+
+The history pages all need the same typed and derived columns (listyear, birthyear
+as int, fisyearathlete, athleteage). They are produced here once per loaded dataset
+and cached by the app, instead of being rebuilt on every rerun.
+
+The prepared frame also uses a compact dtype layout (categoricals for nation, gender
+and list, nullable small integers for positions, float32 for points, an integer
+competitor key). Run ``python prepare.py <dataset>`` for a per-column memory report.
+"""
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from storage import listyear_from_listname
+
+CATEGORY_COLUMNS = ["nationcode", "gender", "listname"]
+
+
+def _smallest_int_dtype(values, nullable=False):
+    """
+    Smallest integer dtype that holds all ``values`` (int8/int16/int32, "Int8"/... if nullable).
+    """
+    lo, hi = values.min(), values.max()
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if pd.isna(lo) or (info.min <= lo and hi <= info.max):
+            name = np.dtype(dtype).name
+            return name.capitalize() if nullable else name
+    return "Int64" if nullable else "int64"
+
+
+def compact_dtypes(df):
+    """
+    Convert the history columns to a compact layout, in place:
+    categoricals for nation/gender/list, nullable small ints for positions,
+    float32 for points and small ints for the year columns and the competitor key
+    (nullable small ints if some ids are missing).
+    """
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype("category")
+    for col in df.columns:
+        if col.endswith("pos"):
+            values = pd.to_numeric(df[col], errors='coerce')
+            df[col] = values.round().astype(_smallest_int_dtype(values, nullable=True))
+        elif col.endswith("points"):
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype("float32")
+    for col in ["competitorid", "listid", "fiscode", "listyear", "birthyear", "fisyearathlete", "athleteage"]:
+        if col in df.columns and pd.api.types.is_integer_dtype(df[col]):
+            df[col] = df[col].astype(_smallest_int_dtype(df[col], nullable=df[col].hasnans))
+    return df
+
+
+def prepare_combined_data(combined_df):
+    """
+    Add the typed and derived columns used by the history pages and compact the dtypes.
+    Returns a new DataFrame, the input is not modified.
+    """
+    df = combined_df.copy(deep=False)  # only whole columns are replaced below
+    df.columns = df.columns.str.lower()
+
+    if 'listyear' not in df.columns:
+        df['listyear'] = listyear_from_listname(df['listname'])
+    df['listyear'] = pd.to_numeric(df['listyear'], errors='coerce').fillna(0).astype(int)
+    df['birthyear'] = pd.to_numeric(df['birthyear'], errors='coerce').fillna(0).astype(int)
+
+    if 'competitorid' in df.columns:
+        # Nullable: a missing or invalid id stays missing instead of becoming the shared id 0
+        df['competitorid'] = pd.to_numeric(df['competitorid'], errors='coerce').astype("Int64")
+
+    # Season number of the athlete in the FIS (first season = age 17) and age at the end of the season
+    df['fisyearathlete'] = (df['listyear'] - df['birthyear'] - 16).clip(lower=0).astype(int)
+    df['athleteage'] = (df['listyear'] - df['birthyear']).clip(lower=0).astype(int)
+    return compact_dtypes(df)
+
+
+def memory_report(before, after):
+    """
+    Per-column memory footprint (bytes, deep) and dtype of two versions of the same frame.
+    """
+    before_bytes = before.memory_usage(index=False, deep=True)
+    after_bytes = after.memory_usage(index=False, deep=True)
+    report = pd.DataFrame({
+        "dtype_before": before.dtypes.astype(str),
+        "bytes_before": before_bytes,
+        "dtype_after": after.dtypes.astype(str),
+        "bytes_after": after_bytes,
+    })
+    report["saved_pct"] = (100 * (1 - report["bytes_after"] / report["bytes_before"])).round(1)
+    report.loc["TOTAL"] = ["", before_bytes.sum(), "", after_bytes.sum(),
+                           round(100 * (1 - after_bytes.sum() / before_bytes.sum()), 1)]
+    return report
+
+
+if __name__ == "__main__":
+    from storage import read_history
+
+    parser = argparse.ArgumentParser(description="Memory report of the combined FIS history before and after preparation.")
+    parser.add_argument("root", nargs="?", default=os.path.join("data", "fis_list_combined"), help="Dataset directory")
+    args = parser.parse_args()
+
+    raw = read_history(args.root)
+    raw['competitorid'] = raw['competitorid'].astype(str)  # as previously cast in the page code
+    prepared = prepare_combined_data(raw)
+    with pd.option_context("display.max_rows", None, "display.width", 200):
+        print(memory_report(raw, prepared[raw.columns]))
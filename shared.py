@@ -0,0 +1,114 @@
+"""
+Read-only DataFrames shared between sessions without copying.
+
+st.cache_data hands every caller a fresh copy of the cached DataFrame; the multi-season history
+was copied on every rerun of every session. Analytics (in a st.cache_resource) instead serves one
+frozen instance of every dataset. Selections and transforms of a frozen frame are ordinary
+DataFrames, while changing the frozen frame itself raises ReadOnlyError. Derived data belongs in
+its own cached transform.
+
+freeze does not copy: the arrays of the frame passed in become read-only in place. This module
+leaves the pandas options alone; the app switches copy-on-write on (views/common.py), so views of
+a frozen frame are copied when written. Without it, as in the batch scripts, writing into such a
+view raises instead. Making the arrays read-only relies on pandas internals (the block manager and
+the buffers of the extension arrays); they are checked at import, so a pandas upgrade that
+changes them fails loudly.
+"""
+import numpy as np
+import pandas as pd
+
+
+class ReadOnlyError(TypeError):
+    pass
+
+
+def _array_buffers(arr):
+    """
+    The numpy buffers holding the values of a column array: the array itself, or the
+    ``_ndarray`` (categorical codes, strings, datetimes) or ``_data``/``_mask`` (nullable numbers)
+    of an extension array. Arrow-backed arrays are immutable and have none.
+    """
+    if isinstance(arr, np.ndarray):
+        return [arr]
+    buffers = [getattr(arr, name, None) for name in ('_ndarray', '_data', '_mask')]
+    buffers = [values for values in buffers if isinstance(values, np.ndarray)]
+    if not buffers and not hasattr(arr, '_pa_array'):
+        raise RuntimeError(f"pandas {pd.__version__}: no known buffers in {type(arr).__name__}, "
+                           "shared.freeze cannot make it read-only")
+    return buffers
+
+
+def _readonly_arrays(df):
+    mgr = getattr(df, '_mgr', None)
+    if not hasattr(mgr, 'arrays'):
+        raise RuntimeError(f"pandas {pd.__version__}: DataFrame has no _mgr.arrays, shared.freeze cannot make it read-only")
+    for arr in mgr.arrays:
+        for values in _array_buffers(arr):
+            values.flags.writeable = False
+
+
+def _check_pandas_internals():
+    """
+    Freeze a frame with the dtypes of the history and check that its buffers were found and
+    locked, so changed pandas internals raise here and not as silently writable shared data.
+    """
+    sample = pd.DataFrame({
+        'float': [1.0, np.nan],
+        'int': pd.array([1, None], dtype="Int32"),
+        'category': pd.Categorical(["SUI", "AUT"]),
+        'text': ["a", "b"],
+    })
+    _readonly_arrays(sample)
+    for arr in sample._mgr.arrays:
+        if any(values.flags.writeable for values in _array_buffers(arr)):
+            raise RuntimeError(f"pandas {pd.__version__}: {type(arr).__name__} stayed writable after shared.freeze")
+
+
+_check_pandas_internals()
+
+
+class ReadOnlyFrame(pd.DataFrame):
+    """
+    DataFrame that cannot be changed: column assignment, deletion, renaming, in-place methods
+    and writes into its arrays raise. Derived frames are plain pandas DataFrames.
+    """
+
+    @property
+    def _constructor(self):
+        return pd.DataFrame
+
+    def _blocked(self, *args, **kwargs):
+        raise ReadOnlyError("Shared dataset is read-only, derive a new DataFrame instead")
+
+    __setitem__ = __delitem__ = insert = pop = _update_inplace = _blocked
+
+    def __setattr__(self, name, value):
+        if name in ('columns', 'index') or (not name.startswith('_') and name in self.columns):
+            self._blocked()
+        super().__setattr__(name, value)
+
+    def copy(self, deep=True):
+        return pd.DataFrame(self).copy(deep=deep)
+
+
+def freeze(obj):
+    """
+    Read-only version of a DataFrame (no copy of the data), of the DataFrames in a dict, tuple or
+    list, or of the ``frame``/``data``/``table`` DataFrame of an index object (CohortIndex, RankingIndex, ...).
+    The data is not copied, so the frame passed in is read-only afterwards as well: freeze frames
+    nobody else writes to, or a ``.copy()`` of them.
+    """
+    if isinstance(obj, ReadOnlyFrame) or obj is None:
+        return obj
+    if isinstance(obj, pd.DataFrame):
+        frozen = ReadOnlyFrame(obj)
+        _readonly_arrays(frozen)
+        return frozen
+    if isinstance(obj, dict):
+        return {key: freeze(value) for key, value in obj.items()}
+    if isinstance(obj, (tuple, list)):
+        return type(obj)(freeze(value) for value in obj)
+    for attr in ('frame', 'data', 'table'):
+        if isinstance(getattr(obj, attr, None), pd.DataFrame):
+            setattr(obj, attr, freeze(getattr(obj, attr)))
+    return obj
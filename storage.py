@@ -0,0 +1,366 @@
+"""
+Columnar storage for the combined FIS history.
+
+The history is written as a Parquet dataset partitioned by listyear and gender,
+one file per FIS list (all lists of a season, not only the last one):
+
+    data/fis_list_combined/listyear=2025/gender=M/list-413-0.parquet
+    data/fis_list_combined/_list_index.parquet          # ListIndex: listid -> season, date, ...
+    data/fis_list_combined/_deltas/list-427.parquet     # list stored as delta (deltas.py)
+    data/fis_list_combined/_version                     # version token, renewed by every write
+
+Readers only open the partitions matching their filters and only decode the
+columns they ask for, so a page that needs ``dhpos`` for men never touches the
+women's lists or the other disciplines. By default read_history returns the last
+list of every season, the season-level view of the pages; read_list returns any
+single list by id. A list stored as delta to its predecessor is rebuilt from the full list
+of its season and the deltas in between.
+"""
+import argparse
+import bisect
+import glob
+import os
+import pickle
+import time
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from deltas import LIST_COLUMNS, apply_deltas, list_delta
+
+PARTITION_COLS = ["listyear", "gender"]
+PARTITIONING = ds.partitioning(
+    pa.schema([("listyear", pa.int32()), ("gender", pa.string())]),
+    flavor="hive",
+)
+LIST_INDEX_NAME = "_list_index.parquet"
+DELTA_DIR = "_deltas"  # leading underscore: not part of the dataset
+VERSION_NAME = "_version"
+
+
+def listyear_from_listname(listname):
+    """
+    Derive the season year from a FIS list name ("... 2023/2024" -> 2024, "... 2024/25" -> 2025).
+    Raises ValueError for names without a "YYYY/YY" or "YYYY/YYYY" season.
+    """
+    # A history has few distinct names: parse each once
+    codes, names = pd.factorize(listname.astype(str))
+    start = pd.Series(names).str.extract(r"(\d{4})/(?:\d{4}|\d{2})\s*$")[0]
+    if start.isna().any():
+        raise ValueError(f"Cannot derive the season from list name(s) {list(names[start.isna().to_numpy()][:5])}")
+    return pd.Series(start.astype(int).to_numpy()[codes] + 1, index=listname.index)
+
+
+def _normalize_for_parquet(df):
+    """
+    Lower-case the column names and give every column a single type so the frame
+    can be written to Parquet (pickles built from many CSVs can mix str and int).
+    """
+    df = df.copy()
+    df.columns = df.columns.str.lower()
+    if 'listyear' not in df.columns:
+        df['listyear'] = listyear_from_listname(df['listname'])
+    df['listyear'] = df['listyear'].astype('int32')
+    for col in df.columns:
+        if df[col].dtype == object:
+            df[col] = df[col].astype('string')
+    return df
+
+
+def write_history(df, root, existing_data_behavior="delete_matching", basename_template="part-{i}.parquet"):
+    """
+    Write the combined history to a Parquet dataset partitioned by listyear and gender.
+    Partitions that are written replace the existing files of that partition, all other
+    partitions are left untouched.
+    """
+    df = _normalize_for_parquet(df)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    ds.write_dataset(
+        table,
+        root,
+        format="parquet",
+        partitioning=PARTITIONING,
+        existing_data_behavior=existing_data_behavior,
+        basename_template=basename_template,
+    )
+    touch_version(root)
+
+
+def touch_version(root):
+    """
+    Record a change of the dataset at ``root`` in its version token (see dataset_version).
+    Called by every function that writes into the dataset.
+    """
+    path = os.path.join(root, VERSION_NAME)
+    with open(path + ".tmp", 'w') as f:
+        f.write(repr(time.time()))
+    os.replace(path + ".tmp", path)
+
+
+def history_filter(gender=None, listyears=None, birthyears=None):
+    """
+    Build a pyarrow filter expression from the optional gender, listyear and birthyear selections.
+    Scalars and lists are both accepted.
+    """
+    expr = None
+    for col, value in (("gender", gender), ("listyear", listyears), ("birthyear", birthyears)):
+        if value is None:
+            continue
+        if isinstance(value, (list, tuple, set, range)):
+            part = ds.field(col).isin(list(value))
+        else:
+            part = ds.field(col) == value
+        expr = part if expr is None else expr & part
+    return expr
+
+
+def _list_files(root, listid):
+    return glob.glob(os.path.join(root, "listyear=*", "gender=*", f"list-{int(listid)}-*.parquet"))
+
+
+def delta_path(root, listid):
+    return os.path.join(root, DELTA_DIR, f"list-{int(listid)}.parquet")
+
+
+def write_list(df, root, previous=None):
+    """
+    Write one FIS list (a single listid) into the dataset as list-<listid>-*.parquet files in its
+    listyear/gender partitions, replacing an earlier version of the same list. The other lists
+    of the season are left untouched.
+    With ``previous`` (the list before it in the season, as returned by read_list) only the delta
+    to it is written, as _deltas/list-<listid>.parquet.
+    """
+    listids = df['listid'].unique()
+    if len(listids) != 1:
+        raise ValueError(f"write_list expects one list, got listids {list(listids)}")
+    listid = int(listids[0])
+    path = delta_path(root, listid)
+    # Files of an earlier version in partitions the list no longer has (e.g. a gender) would remain
+    for old_path in _list_files(root, listid):
+        os.remove(old_path)
+    if previous is None:
+        write_history(df, root, existing_data_behavior="overwrite_or_ignore",
+                      basename_template=f"list-{listid}-{{i}}.parquet")
+        if os.path.exists(path):
+            os.remove(path)
+        return
+    delta = list_delta(previous, _normalize_for_parquet(df))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    pq.write_table(pa.Table.from_pandas(delta, preserve_index=False), path + ".tmp")
+    os.replace(path + ".tmp", path)
+    touch_version(root)
+
+
+class ListIndex:
+    """
+    Index of the lists in a dataset: listid, listyear, number, listname, date (ISO) and rows per
+    list, stored as _list_index.parquet. A list is found by id with a dict lookup and by date
+    with a binary search over the list dates; ``last`` maps every season to its last list.
+    ``delta_of`` is the listid a list is stored as delta to (0: stored in full).
+    """
+    COLUMNS = ['listid', 'listyear', 'number', 'listname', 'date', 'rows', 'delta_of']
+
+    def __init__(self, lists=None):
+        lists = pd.DataFrame(lists if lists is not None else [], columns=self.COLUMNS)
+        # Index files written before delta storage have no delta_of column
+        lists['delta_of'] = lists['delta_of'].fillna(0).astype('int64')
+        self.lists = lists.sort_values(['date', 'number', 'listid'], kind='stable').reset_index(drop=True)
+        self.by_id = {int(row['listid']): row for row in self.lists.to_dict('records')}
+        self.dates = self.lists['date'].tolist()
+        # The list published last in a season replaces the ones before it
+        self.last = {int(year): int(listid) for year, listid in
+                     self.lists.groupby('listyear', sort=True)['listid'].last().items()}
+
+    @classmethod
+    def read(cls, root):
+        path = os.path.join(root, LIST_INDEX_NAME)
+        if not os.path.exists(path):
+            return None
+        return cls(pd.read_parquet(path))
+
+    def write(self, root):
+        os.makedirs(root, exist_ok=True)
+        path = os.path.join(root, LIST_INDEX_NAME)
+        self.lists.to_parquet(path + ".tmp", index=False)
+        os.replace(path + ".tmp", path)
+        touch_version(root)
+
+    def add(self, listid, listyear, number, listname, date, rows, delta_of=0):
+        """
+        New index with the list added (or replaced, if its listid is already indexed).
+        """
+        entry = dict(zip(self.COLUMNS, (int(listid), int(listyear), int(number), str(listname), str(date), int(rows),
+                                        int(delta_of))))
+        others = [row for row in self.by_id.values() if row['listid'] != entry['listid']]
+        return ListIndex(others + [entry])
+
+    def get(self, listid):
+        return self.by_id.get(int(listid))
+
+    def chain(self, listid):
+        """
+        Listids needed to rebuild ``listid``: its full list, then every delta up to ``listid``.
+        """
+        chain = [int(listid)]
+        while self.by_id[chain[0]]['delta_of']:
+            chain.insert(0, int(self.by_id[chain[0]]['delta_of']))
+        return chain
+
+    def at(self, date):
+        """
+        Id of the list in force on ``date`` (ISO string): the last one published on or before it.
+        """
+        i = bisect.bisect_right(self.dates, str(date))
+        return int(self.lists['listid'].iat[i - 1]) if i else None
+
+    def last_lists(self, listyears=None):
+        if listyears is None:
+            return list(self.last.values())
+        if not isinstance(listyears, (list, tuple, set, range)):
+            listyears = [listyears]
+        return [self.last[year] for year in listyears if year in self.last]
+
+    def files(self, root, listids, gender=None):
+        """
+        Parquet files of ``listids``, found in their season directory without listing the dataset.
+        """
+        paths = []
+        for listid in listids:
+            entry = self.get(listid)
+            if entry is not None:
+                gender_dir = f"gender={gender}" if isinstance(gender, str) else "gender=*"
+                paths += sorted(glob.glob(os.path.join(root, f"listyear={entry['listyear']}", gender_dir, f"list-{listid}-*.parquet")))
+        return paths
+
+
+def _filter_frame(df, gender=None, listyears=None, birthyears=None):
+    """
+    The history_filter selection applied to a DataFrame.
+    """
+    mask = pd.Series(True, index=df.index)
+    for col, value in (("gender", gender), ("listyear", listyears), ("birthyear", birthyears)):
+        if value is not None:
+            values = list(value) if isinstance(value, (list, tuple, set, range)) else [value]
+            mask &= df[col].isin(values)
+    return df[mask]
+
+
+def _read_files(root, files, columns=None, expr=None):
+    dataset = ds.dataset(files, format="parquet", partitioning=PARTITIONING, partition_base_dir=root)
+    return dataset.to_table(columns=columns, filter=expr).to_pandas()
+
+
+def _rebuild_list(root, index, listid, gender=None):
+    """
+    A list stored as delta: its season's full list with the chain of deltas applied.
+    """
+    chain = index.chain(listid)
+    base = _read_files(root, index.files(root, chain[:1], gender))
+    filters = [("gender", "==", gender)] if isinstance(gender, str) else None
+    tables = [pq.read_table(delta_path(root, delta_id), filters=filters) for delta_id in chain[1:]]
+    # One conversion to pandas for the deltas before the last one, applied back to back they
+    # are one delta; only the last one's position exceptions apply to the list
+    deltas = [pa.concat_tables(tables[:-1]).to_pandas()] if len(tables) > 1 else []
+    deltas += [table.to_pandas() for table in tables[-1:]]
+    entry = index.get(listid)
+    df = apply_deltas(base, deltas)
+    for col in LIST_COLUMNS:
+        value = pd.Series(entry[col], index=df.index)
+        df[col] = value.astype('category' if isinstance(base[col].dtype, pd.CategoricalDtype) else base[col].dtype)
+    return df[base.columns]
+
+
+def read_history(root, columns=None, gender=None, listyears=None, birthyears=None, lists="last"):
+    """
+    Read the combined history with column projection and predicate pushdown.
+    Partition filters (gender, listyear) prune whole directories, the birthyear filter
+    is pushed down to the Parquet row groups.
+    ``lists`` selects the lists of a dataset with a list index: "last" (the last list of every
+    season, one row per athlete and season as the pages expect), "all" or a list of listids.
+    Only their files are opened, lists stored as delta are rebuilt (see deltas.py). Datasets
+    without an index hold one list per season and are read entirely.
+    """
+    index = ListIndex.read(root)
+    expr = history_filter(gender, listyears, birthyears)
+    if columns is not None:
+        columns = list(dict.fromkeys(columns))
+    if index is None:
+        return ds.dataset(root, format="parquet", partitioning=PARTITIONING).to_table(columns=columns, filter=expr).to_pandas()
+
+    if isinstance(lists, str):
+        listids = index.last_lists(listyears) if lists == "last" else index.lists['listid'].tolist()
+    else:
+        listids = list(lists)
+    delta_ids = [listid for listid in listids if index.get(listid) is not None and index.get(listid)['delta_of']]
+    files = index.files(root, [listid for listid in listids if listid not in delta_ids], gender)
+    frames = []
+    if files or not delta_ids:
+        # Nothing selected: the whole dataset with a filter that matches no row
+        if not files:
+            files = root
+            nothing = ds.field("listid").isin([])
+            expr = nothing if expr is None else expr & nothing
+        frames.append(_read_files(root, files, columns, expr))
+    for listid in delta_ids:
+        df = _filter_frame(_rebuild_list(root, index, listid, gender), gender, listyears, birthyears)
+        frames.append(df if columns is None else df[columns])
+    if len(frames) == 1:
+        return frames[0]
+    df = pd.concat(frames, ignore_index=True)
+    for col, dtype in frames[0].dtypes.items():
+        if isinstance(dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype('category')
+    return df
+
+
+def read_list(root, listid, columns=None, gender=None):
+    """
+    One FIS list of the dataset by its listid (see ListIndex.at for the list in force on a date).
+    """
+    return read_history(root, columns=columns, gender=gender, lists=[listid])
+
+
+def dataset_version(path):
+    """
+    Version token of the history at ``path`` (dataset directory or pickle file). Used as cache
+    key so derived data is rebuilt after an update. A dataset has it in its _version file, which
+    is read on every script run instead of listing the dataset; datasets written before that
+    file existed fall back to the latest modification time of their files.
+    """
+    try:
+        with open(os.path.join(path, VERSION_NAME)) as f:
+            return float(f.read())
+    except (OSError, ValueError):
+        pass
+    if not os.path.exists(path):
+        return None
+    if os.path.isfile(path):
+        return os.path.getmtime(path)
+    latest = os.path.getmtime(path)
+    for dirpath, _, filenames in os.walk(path):
+        for filename in filenames:
+            latest = max(latest, os.path.getmtime(os.path.join(dirpath, filename)))
+    return latest
+
+
+def convert_pickle(pickle_path, root):
+    """
+    Convert a combined history pickle (as written by update_FIS_listCombined.ipynb) into the
+    partitioned dataset.
+    """
+    with open(pickle_path, 'rb') as f:
+        combined_df = pickle.load(f)
+    write_history(combined_df, root)
+    return combined_df.shape
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert the combined FIS history pickle into a partitioned Parquet dataset.")
+    parser.add_argument("pickle_path", help="Path to fis_list_combined_*.pkl")
+    parser.add_argument("root", nargs="?", default=os.path.join("data", "fis_list_combined"), help="Output dataset directory")
+    args = parser.parse_args()
+
+    rows, cols = convert_pickle(args.pickle_path, args.root)
+    print(f"Wrote {rows} rows x {cols} columns to {args.root}")
@@ -0,0 +1,81 @@
+"""
+Small synthetic FIS histories (benchmarks/synthetic.py) built into stores in a temporary directory.
+"""
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from build_fis_history import build_history  # noqa: E402
+from prepare import prepare_combined_data  # noqa: E402
+from storage import read_history  # noqa: E402
+from synthetic import generate_lists  # noqa: E402
+
+SEASONS = 2
+LISTS_PER_SEASON = 3
+SCALE = 0.02  # about 260 athletes per list
+
+
+def _quiet(*args, **kwargs):
+    pass
+
+
+def _rerank(fis_list):
+    for disciplin in ['DH', 'SL', 'GS', 'SG', 'AC']:
+        fis_list[f'{disciplin}pos'] = fis_list.groupby('Gender')[f'{disciplin}points'].rank(method='min')
+    return fis_list
+
+
+@pytest.fixture(scope="session")
+def source_lists(tmp_path_factory):
+    """
+    Directory of FIS list CSVs. The middle list of every season drops some athletes (who are back
+    in the last list) and has one position that is not the rank of the points, as FIS lists do.
+    """
+    directory = tmp_path_factory.mktemp("lists")
+    for listyear, listid, fis_list in generate_lists(SEASONS, SCALE, 2025, seed=1, lists_per_season=LISTS_PER_SEASON):
+        if listid % 25 == 1:
+            fis_list = _rerank(fis_list.drop(index=fis_list.index[::40]).reset_index(drop=True))
+            ranked = fis_list.index[fis_list['SLpos'].notna()]
+            fis_list.loc[ranked[0], 'SLpos'] = fis_list.loc[ranked[0], 'SLpos'] + 2
+        fis_list.to_csv(directory / f"FIS-points-list-AL-{listyear}-{listid}.csv", index=False)
+    return str(directory)
+
+
+@pytest.fixture(scope="session")
+def full_store(source_lists, tmp_path_factory):
+    store = str(tmp_path_factory.mktemp("full") / "fis_list_combined")
+    build_history(source_lists, store, deltas=False, log=_quiet)
+    return store
+
+
+@pytest.fixture(scope="session")
+def delta_store(source_lists, tmp_path_factory):
+    store = str(tmp_path_factory.mktemp("deltas") / "fis_list_combined")
+    build_history(source_lists, store, deltas=True, log=_quiet)
+    return store
+
+
+@pytest.fixture(scope="session")
+def prepared_history(full_store):
+    """
+    Last list of every season with the derived columns of prepare.py, as the pages use it.
+    """
+    return prepare_combined_data(read_history(full_store))
+
+
+def normalized(df):
+    """
+    ``df`` in a canonical row and column order, for comparing stores.
+    """
+    df = df.sort_values([col for col in ('listid', 'listyear', 'competitorid') if col in df]).reset_index(drop=True)
+    return df[sorted(df.columns)]
+
+
+def assert_same_frame(a, b):
+    pd.testing.assert_frame_equal(normalized(a), normalized(b), check_categorical=False)
@@ -0,0 +1,32 @@
+import shutil
+
+import numpy as np
+import pytest
+
+from analytics import DEVELOPMENT_COLUMNS, Analytics
+
+
+@pytest.mark.parametrize("mapped", [True, False])
+def test_one_prepared_history_per_gender(full_store, tmp_path, mapped):
+    store = full_store
+    if not mapped:
+        # A copy without the memory-mapped layout next to it: prepared from the dataset
+        store = str(tmp_path / "fis_list_combined")
+        shutil.copytree(full_store, store)
+    analytics = Analytics(store, results_dir=str(tmp_path / "results"))
+    for gender in ('M', 'W'):
+        for disciplin in ('DH', 'SL', 'AC'):
+            analytics.birthyear_over_seasons(2000, 3, gender, disciplin)
+            analytics.season_counts(2000, 3, gender, disciplin, (5, 10))
+        analytics.development_over_seasons(2000, 3, gender, 10)
+        analytics.trajectories(gender)
+    assert set(analytics._data) == {'cube'} | {(kind, gender) for kind in ('prepared', 'cohort_index', 'trajectories')
+                                              for gender in ('M', 'W')}
+
+    # Column selections and indexes share the data of the prepared history
+    prepared = analytics.prepared(gender='M')
+    view = analytics.prepared(DEVELOPMENT_COLUMNS, 'M')
+    assert set(view.columns) == set(DEVELOPMENT_COLUMNS) | {'fisyearathlete', 'athleteage'}
+    assert np.shares_memory(view['birthyear'].to_numpy(), prepared['birthyear'].to_numpy())
+    assert analytics.cohort_index('M').frame is prepared
+    assert analytics.trajectories('M').frame is prepared
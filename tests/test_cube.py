@@ -0,0 +1,82 @@
+import glob
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+from build_fis_history import build_history
+from cube import CUBE_THRESHOLDS, CUBE_TOPS, CohortCube, read_cube
+from prepare import prepare_combined_data
+from storage import ListIndex, read_history
+from utils import CohortIndex, mean_topX, nation_counts_by_cohort, topX_means_by_cohort
+
+TOPS = [1, 3, 10, 50]
+DISCIPLINES = ['DH', 'SL', 'AC']
+
+
+@pytest.fixture(scope="module")
+def combined_df(full_store):
+    return prepare_combined_data(read_history(full_store))
+
+
+def cohorts(combined_df):
+    pairs = combined_df[['birthyear', 'listyear']].drop_duplicates().astype(int)
+    # A cohort with no athletes in a cubed season is looked up as well
+    return sorted(map(tuple, pairs.to_numpy().tolist())) + [(1900, int(pairs['listyear'].max()))]
+
+
+@pytest.mark.parametrize("gender", ['M', 'W'])
+def test_cube_lookup_matches_live_mean_topX(full_store, combined_df, gender):
+    cube = CohortCube(read_cube(full_store))
+    selected = cohorts(combined_df)
+    _, missing = cube.mean_topX(gender, 'SL', selected, TOPS)
+    assert missing == []
+
+    keys = ['disciplin', 'top', 'birthyear', 'season']
+    live = mean_topX(CohortIndex(combined_df), selected, gender, TOPS, DISCIPLINES)
+    cubed = mean_topX(CohortIndex(combined_df, cube=cube), selected, gender, TOPS, DISCIPLINES)
+    assert len(live) == len(selected) * len(TOPS) * len(DISCIPLINES)
+    pd.testing.assert_frame_equal(cubed.sort_values(keys).reset_index(drop=True),
+                                  live.sort_values(keys).reset_index(drop=True), check_dtype=False, rtol=1e-5)
+
+
+def test_cube_covers_the_last_list_of_every_season(full_store, combined_df):
+    cube = read_cube(full_store)
+    assert sorted(cube['listyear'].unique()) == sorted(combined_df['listyear'].unique())
+    assert set(cube['disciplin']) >= set(DISCIPLINES)
+
+
+def test_cube_is_updated_for_a_corrected_last_list(source_lists, tmp_path):
+    directory = tmp_path / "lists"
+    shutil.copytree(source_lists, directory)
+    store = str(tmp_path / "fis_list_combined")
+    build_history(str(directory), store, log=lambda *args: None)
+
+    # The last list of the last season is published again with corrected SUI results
+    index = ListIndex.read(store)
+    last = index.last[max(index.last)]
+    path, = glob.glob(os.path.join(directory, f"FIS-points-list-AL-*-{last}.csv"))
+    fis_list = pd.read_csv(path)
+    sui_men = (fis_list['Nationcode'] == 'SUI') & (fis_list['Gender'] == 'M') & fis_list['SLpos'].notna()
+    fis_list.loc[sui_men, ['SLpoints', 'SLpos']] = 0.0, 1.0
+    fis_list.to_csv(path, index=False)
+    build_history(str(directory), store, log=lambda *args: None)
+    assert ListIndex.read(store).last == index.last
+
+    combined_df = prepare_combined_data(read_history(store))
+    men = combined_df[combined_df['gender'] == 'M']
+    cube = read_cube(store).set_index(['gender', 'disciplin', 'birthyear', 'listyear']).sort_index().loc[('M', 'SL')]
+    means = topX_means_by_cohort(men, 'SL', CUBE_TOPS)
+    counts = nation_counts_by_cohort(men, 'SL', CUBE_THRESHOLDS)
+    for top in CUBE_TOPS:
+        for kind in ('meanint', 'meansui'):
+            live = means[(kind, top)]
+            pd.testing.assert_series_equal(cube[f"{kind}_{top}"].reindex(live.index).astype('float64'), live,
+                                           check_names=False, check_index_type=False, rtol=1e-5)
+    for top in CUBE_THRESHOLDS:
+        live = counts[top]
+        pd.testing.assert_series_equal(cube[f"suitop_{top}"].reindex(live.index).astype('int64'), live.astype('int64'),
+                                       check_names=False, check_index_type=False)
+    corrected = means.loc[(slice(None), max(index.last)), ('meansui', 1)].dropna()
+    assert len(corrected) and (corrected == 1.0).all()
@@ -0,0 +1,122 @@
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from build_fis_history import load_manifest, main
+from conftest import assert_same_frame
+from deltas import apply_deltas, derive_positions, list_delta
+from storage import ListIndex, read_history, read_list
+
+
+def fis_list(points, genders=None, ids=None):
+    """
+    Small list in the layout of the history, positions derived from the points.
+    """
+    ids = ids or list(range(1, len(points) + 1))
+    df = pd.DataFrame({
+        'competitorid': ids,
+        'competitorname': [f"ATHLETE {i}" for i in ids],
+        'nationcode': ['SUI' if i % 3 == 0 else 'AUT' for i in ids],
+        'gender': genders or ['M'] * len(ids),
+        'birthyear': [2000 + i % 5 for i in ids],
+        'slpoints': points,
+    })
+    return df.join(derive_positions(df, ['slpos']))
+
+
+def assert_rebuilt(base, deltas, expected):
+    pd.testing.assert_frame_equal(apply_deltas(base, deltas), expected.sort_values('competitorid').reset_index(drop=True))
+
+
+def test_ties_need_no_position_exception():
+    previous = fis_list([10.0, 20.0, 30.0, np.nan])
+    current = fis_list([10.0, 20.0, 20.0, 40.0])
+    assert current['slpos'].tolist() == [1, 2, 2, 4]
+    delta = list_delta(previous, current)
+    assert 'position' not in set(delta['change'])
+    assert_rebuilt(previous, [delta], current)
+
+
+def test_position_exception_is_kept():
+    previous = fis_list([10.0, 20.0, 30.0, 40.0])
+    current = fis_list([10.0, 25.0, 30.0, 40.0])
+    current.loc[2, 'slpos'] = 7.0  # published position that is not the rank of the points
+    delta = list_delta(previous, current)
+    exceptions = delta[delta['change'] == 'position']
+    assert exceptions['competitorid'].tolist() == [3]
+    assert_rebuilt(previous, [delta], current)
+
+
+def test_position_exception_applies_to_its_own_list_only():
+    first = fis_list([10.0, 20.0, 30.0, 40.0])
+    second = fis_list([10.0, 20.0, 35.0, 40.0])
+    second.loc[0, 'slpos'] = 2.0
+    third = fis_list([12.0, 20.0, 35.0, 40.0])
+    deltas = [list_delta(first, second), list_delta(second, third)]
+    assert_rebuilt(first, deltas[:1], second)
+    assert_rebuilt(first, deltas, third)
+
+
+def test_positions_per_gender_with_added_and_removed_athletes():
+    previous = fis_list([10.0, 20.0, 15.0, 30.0], genders=['M', 'M', 'W', 'W'])
+    current = fis_list([20.0, 5.0, 30.0, 12.0], genders=['M', 'W', 'W', 'M'], ids=[2, 5, 4, 6])
+    current.loc[1, 'slpos'] = 3.0
+    delta = list_delta(previous, current)
+    assert set(delta['change']) == {'added', 'removed', 'position'}
+    assert_rebuilt(previous, [delta], current)
+
+
+def test_delta_store_holds_deltas(full_store, delta_store):
+    full, deltas = ListIndex.read(full_store), ListIndex.read(delta_store)
+    assert (full.lists['delta_of'] == 0).all()
+    # Every list after the first of a season is stored as delta to the one before it
+    assert (deltas.lists.groupby('listyear')['delta_of'].apply(lambda d: (d.iloc[1:] > 0).all())).all()
+    assert full.lists['listid'].tolist() == deltas.lists['listid'].tolist()
+
+
+def test_list_index_chain(delta_store):
+    index = ListIndex.read(delta_store)
+    for listyear, listid in index.last.items():
+        chain = index.chain(listid)
+        assert index.get(chain[0])['delta_of'] == 0
+        assert [index.get(lid)['listyear'] for lid in chain] == [listyear] * len(chain)
+        assert len(chain) == index.lists['listyear'].eq(listyear).sum()
+
+
+def test_delta_store_matches_full_store(full_store, delta_store):
+    for listid in ListIndex.read(full_store).lists['listid']:
+        for gender in (None, 'W'):
+            assert_same_frame(read_list(full_store, listid, gender=gender), read_list(delta_store, listid, gender=gender))
+
+
+@pytest.mark.parametrize("selection", [
+    {},
+    {'lists': 'all'},
+    {'columns': ['competitorid', 'slpos', 'listyear'], 'gender': 'M', 'birthyears': range(1995, 2001)},
+])
+def test_delta_store_history_matches_full_store(full_store, delta_store, selection):
+    assert_same_frame(read_history(full_store, **selection), read_history(delta_store, **selection))
+
+
+def test_deltas_option_can_be_turned_off(source_lists, full_store, tmp_path):
+    files = sorted(os.listdir(source_lists))
+    directory, store = tmp_path / "lists", str(tmp_path / "fis_list_combined")
+    directory.mkdir()
+
+    def ingest(files, *options):
+        for file in files:
+            shutil.copy(os.path.join(source_lists, file), directory)
+        assert main([str(directory), "--store", store, "--no-precompute", *options]) == 0
+
+    ingest(files[:2], "--deltas")
+    ingest(files[2:3])
+    assert load_manifest(store)["deltas"]
+    ingest(files[3:], "--no-deltas")
+    assert not load_manifest(store)["deltas"]
+    # Lists ingested before keep their deltas, the later ones are stored in full
+    index = ListIndex.read(store)
+    assert [index.get(listid)['delta_of'] > 0 for listid in index.lists['listid']] == [False, True, True, False, False, False]
+    assert_same_frame(read_history(store, lists='all'), read_history(full_store, lists='all'))
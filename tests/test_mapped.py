@@ -0,0 +1,30 @@
+import pandas as pd
+
+from mapped import SORT_KEYS, open_mapped
+from storage import dataset_version
+
+
+def expected(prepared_history, gender=None, columns=None):
+    df = prepared_history.sort_values(SORT_KEYS, kind='stable').reset_index(drop=True)
+    if gender is not None:
+        df = df[df['gender'] == gender].reset_index(drop=True)
+    if columns is not None:
+        df = df[[col for col in df.columns if col in set(columns) | {'fisyearathlete', 'athleteage'}]]
+    return df
+
+
+def test_mapped_history_matches_prepared_history(full_store, prepared_history):
+    version = dataset_version(full_store)
+    for gender in (None, 'M', 'W', 'X'):
+        for columns in (None, ['competitorid', 'gender', 'birthyear', 'listyear', 'nationcode', 'slpos']):
+            mapped = open_mapped(full_store, version, columns, gender)
+            reference = expected(prepared_history, gender, columns)
+            # Text columns are stored as categories
+            reference = reference.astype({col: 'category' for col, dtype in mapped.dtypes.items()
+                                          if isinstance(dtype, pd.CategoricalDtype)})
+            # A copy, the mapped columns are memmap views
+            pd.testing.assert_frame_equal(mapped.copy(), reference, check_categorical=False)
+
+
+def test_mapped_history_of_other_version_is_not_opened(full_store):
+    assert open_mapped(full_store, dataset_version(full_store) + 1) is None
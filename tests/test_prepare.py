@@ -0,0 +1,31 @@
+import pandas as pd
+
+from prepare import prepare_combined_data
+from utils import TrajectoryIndex
+
+
+def history(competitorids):
+    n = len(competitorids)
+    return pd.DataFrame({
+        'listname': ["FIS 2024"] * n,
+        'listyear': [2024] * n,
+        'birthyear': [2000] * n,
+        'competitorid': competitorids,
+        'slpos': list(range(1, n + 1)),
+    })
+
+
+def test_competitorid_is_compact_integer(prepared_history):
+    assert prepared_history['competitorid'].dtype == "int32"
+    assert prepared_history['fisyearathlete'].dtype == "int8"
+
+
+def test_invalid_competitorid_stays_missing():
+    prepared = prepare_combined_data(history(["1001", "", "x", "1002", None]))
+    assert prepared['competitorid'].dtype == "Int16"
+    assert prepared['competitorid'].isna().tolist() == [False, True, True, False, True]
+    # Athletes without a valid id are not merged into one trajectory
+    trajectories = TrajectoryIndex(prepared)
+    assert sorted(trajectories.offsets) == [1001, 1002]
+    assert trajectories.get(0).empty
+    assert trajectories.get(1002)['slpos'].tolist() == [4]
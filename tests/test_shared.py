@@ -0,0 +1,49 @@
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import ROOT
+from shared import ReadOnlyError, freeze
+
+
+def sample():
+    return pd.DataFrame({
+        'slpos': [1.0, np.nan, 3.0],
+        'competitorid': pd.array([10, None, 12], dtype="Int32"),
+        'nationcode': pd.Categorical(["SUI", "AUT", "SUI"]),
+    })
+
+
+def test_frozen_frame_cannot_be_changed():
+    frozen = freeze(sample())
+    with pytest.raises(ReadOnlyError):
+        frozen['slpos'] = 0.0
+    with pytest.raises(ReadOnlyError):
+        frozen.drop(columns='slpos', inplace=True)
+    with pytest.raises(ValueError):
+        frozen['slpos'].to_numpy()[0] = 0.0
+    # Derived frames are plain, writable DataFrames
+    derived = frozen.copy()
+    derived['slpos'] = 0.0
+    assert frozen['slpos'].iloc[0] == 1.0
+
+
+def test_freeze_makes_the_source_read_only():
+    source = sample()
+    frozen = freeze(source)
+    # No copy: the source shares the data and is read-only as well
+    assert np.shares_memory(frozen['slpos'].to_numpy(), source['slpos'].to_numpy())
+    with pytest.raises(ValueError):
+        source['slpos'].to_numpy()[0] = 0.0
+    with pytest.raises(ValueError):
+        source['competitorid'].array._data[0] = 0
+
+
+def test_headless_modules_leave_pandas_options_alone():
+    code = ("import pandas as pd; import shared, analytics, build_fis_history, export_charts; "
+            "print(pd.get_option('mode.copy_on_write'))")
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,63 @@
+import glob
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+from conftest import assert_same_frame
+from storage import ListIndex, dataset_version, listyear_from_listname, read_list, write_list
+
+
+def test_listyear_from_listname():
+    names = pd.Series(["21. FIS points list 2023/2024", "1. FIS points list 2024/25", "FIS points list 2025/26 ",
+                       "21. FIS points list 2023/2024"], index=[3, 5, 7, 9])
+    listyears = listyear_from_listname(names)
+    assert listyears.tolist() == [2024, 2025, 2026, 2024]
+    assert listyears.index.tolist() == [3, 5, 7, 9]
+
+
+def test_listyear_from_listname_unparseable():
+    with pytest.raises(ValueError, match="Season 2024"):
+        listyear_from_listname(pd.Series(["FIS points list 2024/2025", "Season 2024"]))
+
+
+def test_list_index_at():
+    index = ListIndex([
+        (100, 2024, 1, "1. FIS points list 2023/2024", "2023-07-01", 10, 0),
+        (101, 2024, 2, "2. FIS points list 2023/2024", "2023-11-15", 10, 100),
+        (125, 2025, 1, "1. FIS points list 2024/25", "2024-07-01", 10, 0),
+    ])
+    assert index.at("2023-06-30") is None
+    assert index.at("2023-07-01") == 100
+    assert index.at("2023-11-14") == 100
+    assert index.at("2023-11-15") == 101
+    assert index.at("2024-06-30") == 101
+    assert index.at("2030-01-01") == 125
+    assert index.last == {2024: 101, 2025: 125}
+
+
+def test_list_index_at_of_built_store(full_store):
+    index = ListIndex.read(full_store)
+    for row in index.lists.to_dict('records'):
+        assert index.at(row['date']) == row['listid']
+
+
+def test_dataset_version_changes_with_the_index(tmp_path):
+    store = str(tmp_path / "store")
+    assert dataset_version(store) is None
+    ListIndex([(100, 2024, 1, "1. FIS points list 2023/2024", "2023-07-01", 10, 0)]).write(store)
+    first = dataset_version(store)
+    ListIndex().write(store)
+    assert dataset_version(store) > first
+
+
+def test_rewritten_list_drops_partitions_it_no_longer_has(full_store, tmp_path):
+    store = str(tmp_path / "fis_list_combined")
+    shutil.copytree(full_store, store)
+    listid = int(ListIndex.read(store).lists['listid'].iloc[0])
+    men = read_list(store, listid, gender='M')
+    write_list(men, store)
+    assert not glob.glob(os.path.join(store, "listyear=*", "gender=W", f"list-{listid}-*.parquet"))
+    assert read_list(store, listid, gender='W').empty
+    assert_same_frame(read_list(store, listid).astype({'gender': str}), men.astype({'gender': str}))
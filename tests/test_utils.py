@@ -0,0 +1,206 @@
+"""
+The indexed and vectorized kernels of utils.py against the per-cohort pandas code they replaced.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from storage import ListIndex, read_list
+from utils import (
+    CohortIndex,
+    RankingIndex,
+    TrajectoryIndex,
+    _display_table,
+    collect_data,
+    collect_data_Entw,
+    collect_data_No,
+    collect_data_tops,
+    get_cohort,
+    get_cohorts,
+    getNoTopX_SUI,
+)
+
+GENDERS = ['M', 'W']
+BIRTHYEARS = range(1990, 2011)
+
+
+def baseline_cohort(combined_df, birthyear, season, Gender):
+    return combined_df[(combined_df['birthyear'] == birthyear) &
+                       (combined_df['listyear'] == season) &
+                       (combined_df['gender'] == Gender)]
+
+
+def baseline_mean_top(df_season, disciplin, top, sui):
+    """
+    getMeanTopX_Int / getMeanTopX_SUI of the original utils.py.
+    """
+    col_name = str(disciplin).lower() + 'pos'
+    df = df_season[(df_season['nationcode'] == 'SUI') == sui]
+    return df.sort_values(by=col_name, ascending=True).head(top)[col_name].astype('float64').mean()
+
+
+def baseline_means(combined_df, cohorts, Gender, tops, disciplin):
+    """
+    collect_data of the original utils.py for every k in ``tops``, as {top: DataFrame}.
+    """
+    rows = {top: [] for top in tops}
+    for birthyear, season in cohorts:
+        df_season = baseline_cohort(combined_df, birthyear, season, Gender)
+        for top in tops:
+            rows[top].append({'birthyear': birthyear, 'season': season,
+                              'meanint': baseline_mean_top(df_season, disciplin, top, False),
+                              'meansui': baseline_mean_top(df_season, disciplin, top, True)})
+    return {top: pd.DataFrame(rows[top]) for top in tops}
+
+
+@pytest.fixture(scope="module")
+def latest(full_store):
+    index = ListIndex.read(full_store)
+    data = read_list(full_store, index.last[max(index.last)]).reset_index(drop=True)
+    # Athletes with the same position, as FIS lists have them
+    for discipline in RankingIndex.DISCIPLINES:
+        ranked = data.index[data[discipline + "pos"].notna()]
+        data.loc[ranked[1::7], discipline + "pos"] = data.loc[ranked[::7][:len(ranked[1::7])], discipline + "pos"].to_numpy()
+    return data
+
+
+def baseline_table(data, discipline, n, birthyears=None, gender=None, nation=None, kind='stable'):
+    """
+    create_table of the original app on the filtered list.
+    """
+    mask = pd.Series(True, index=data.index)
+    if birthyears is not None:
+        mask &= data['birthyear'].between(min(birthyears), max(birthyears))
+    if gender is not None:
+        mask &= data['gender'] == gender
+    if nation is not None:
+        mask &= data['nationcode'] == nation
+    pos = discipline + "pos"
+    df = data[mask].dropna(subset=[pos]).sort_values(by=pos, ascending=True, kind=kind)
+    return _display_table(df.head(n), discipline)
+
+
+@pytest.mark.parametrize("n, birthyears, gender, nation", [
+    (3, None, None, None),
+    (3, (2000, 2000), 'M', None),
+    (10, (1995, 2005), 'W', 'SUI'),
+    (50, None, 'M', 'AUT'),
+    (300, None, 'W', None),
+    (5, (1900, 1901), 'M', None),
+    (5, None, 'M', 'XXX'),
+])
+def test_ranking_index_matches_baseline_table(latest, n, birthyears, gender, nation):
+    ranking = RankingIndex(latest)
+    for discipline in RankingIndex.DISCIPLINES:
+        table = ranking.top_table(discipline, n, birthyears, gender, nation)
+        pd.testing.assert_frame_equal(table, baseline_table(latest, discipline, n, birthyears, gender, nation))
+        # The unstable sort of the original app may order tied athletes differently, not the ranks
+        unstable = baseline_table(latest, discipline, n, birthyears, gender, nation, kind='quicksort')
+        np.testing.assert_array_equal(table['Rank'].to_numpy(), unstable['Rank'].to_numpy())
+
+
+def test_ranking_index_keeps_list_order_of_ties():
+    data = pd.DataFrame({
+        'competitorname': list("ABCDE"),
+        'nationcode': ['SUI', 'AUT', 'SUI', 'ITA', 'AUT'],
+        'gender': ['M'] * 5,
+        'birthyear': [2000] * 5,
+        **{f"{d}points": [10.0, 5.0, 10.0, 5.0, 1.0] for d in RankingIndex.DISCIPLINES},
+        **{f"{d}pos": [3.0, 2.0, 3.0, 2.0, 1.0] for d in RankingIndex.DISCIPLINES},
+    })
+    table = RankingIndex(data).top_table('sl', 5)
+    assert table['Name'].tolist() == list("EBDAC")
+
+
+def all_cohorts(prepared_history):
+    seasons = sorted(prepared_history['listyear'].unique())
+    return [(birthyear, season) for birthyear in BIRTHYEARS for season in seasons + [max(seasons) + 1]]
+
+
+def test_cohort_index_matches_boolean_scan(prepared_history):
+    index = CohortIndex(prepared_history)
+    for gender in GENDERS:
+        cohorts = all_cohorts(prepared_history)
+        for birthyear, season in cohorts:
+            expected = baseline_cohort(prepared_history, birthyear, season, gender)
+            for combined_df in (index, prepared_history):
+                cohort = get_cohort(combined_df, birthyear, season, gender)
+                pd.testing.assert_frame_equal(cohort.sort_values('competitorid').reset_index(drop=True),
+                                              expected.sort_values('competitorid').reset_index(drop=True))
+        rows = get_cohorts(index, cohorts, gender)
+        expected = pd.concat([baseline_cohort(prepared_history, b, s, gender) for b, s in cohorts])
+        assert sorted(rows['competitorid'].tolist()) == sorted(expected['competitorid'].tolist())
+
+
+# (birthyear, FISYear) whose cohorts over birthyears and over seasons reach the synthetic seasons
+COHORT_QUERIES = [(1994, 4), (1998, 1), (2000, 3)]
+
+
+@pytest.mark.parametrize("disciplin", ['DH', 'SL', 'GS', 'SG', 'AC'])
+def test_top_k_means_match_baseline(prepared_history, disciplin):
+    index = CohortIndex(prepared_history)
+    tops = [1, 2, 3, 10, 50]
+    for gender in GENDERS:
+        for birthyear, FISYear in COHORT_QUERIES:
+            over_birthyears = [(birthyear + i, birthyear + i + 16 + FISYear) for i in range(11)]
+            over_seasons = [(birthyear, birthyear + 16 + FISYear + i) for i in range(11)]
+            expected = baseline_means(prepared_history, over_birthyears, gender, tops, disciplin)
+            expected_entw = baseline_means(prepared_history, over_seasons, gender, [10], disciplin)[10]
+            assert any(len(baseline_cohort(prepared_history, b, s, gender)) for b, s in over_birthyears + over_seasons)
+            for combined_df in (index, prepared_history):
+                results = collect_data_tops(birthyear, FISYear, gender, tops, disciplin, combined_df)
+                for top in tops:
+                    pd.testing.assert_frame_equal(results[top], expected[top], check_dtype=False)
+                pd.testing.assert_frame_equal(collect_data(birthyear, FISYear, gender, 3, disciplin, combined_df),
+                                              expected[3], check_dtype=False)
+                pd.testing.assert_frame_equal(collect_data_Entw(birthyear, FISYear, gender, 10, disciplin, combined_df),
+                                              expected_entw, check_dtype=False)
+
+
+def baseline_counts(df_season, disciplin, thresholds):
+    """
+    getNoTopX_SUI of the original utils.py for any thresholds, on the ranked athletes only: since
+    user-008 athletes without a position no longer count towards a top N.
+    """
+    col_name = str(disciplin).lower() + 'pos'
+    df_season = df_season.dropna(subset=[col_name]).sort_values(by=col_name, ascending=True)
+    return [int((df_season.head(top)['nationcode'] == 'SUI').sum()) for top in thresholds]
+
+
+@pytest.mark.parametrize("disciplin", ['DH', 'SL', 'AC'])
+def test_nation_counts_match_baseline(prepared_history, disciplin):
+    index = CohortIndex(prepared_history)
+    thresholds = (1, 2, 5, 30, 50, 70)
+    for gender in GENDERS:
+        for birthyear, FISYear in COHORT_QUERIES:
+            cohorts = [(birthyear + i, birthyear + i + 16 + FISYear) for i in range(11)]
+            expected = pd.DataFrame([
+                {'birthyear': b, 'season': s,
+                 **{f"top{top}": count for top, count in
+                    zip(thresholds, baseline_counts(baseline_cohort(prepared_history, b, s, gender), disciplin, thresholds))}}
+                for b, s in cohorts
+            ])
+            for combined_df in (index, prepared_history):
+                pd.testing.assert_frame_equal(collect_data_No(birthyear, FISYear, gender, disciplin, combined_df, thresholds),
+                                              expected, check_dtype=False)
+            for b, s in cohorts:
+                df_season = baseline_cohort(prepared_history, b, s, gender)
+                assert list(getNoTopX_SUI(df_season, disciplin)) == baseline_counts(df_season, disciplin, (30, 50, 70))
+
+
+def test_nation_counts_skip_unranked_athletes():
+    df_season = pd.DataFrame({'nationcode': ['SUI', 'AUT', 'SUI', 'SUI'], 'slpos': [2.0, 1.0, np.nan, 5.0]})
+    # The original getNoTopX_SUI counted the unranked SUI athlete as well: (3, 3, 3)
+    assert getNoTopX_SUI(df_season, 'SL') == (2, 2, 2)
+
+
+def test_trajectory_index_matches_competitor_filter(prepared_history):
+    trajectories = TrajectoryIndex(prepared_history)
+    ids = prepared_history['competitorid'].drop_duplicates().tolist()[::5] + [-1]
+    for competitorid in ids:
+        # The original pages filtered the history by competitorid and sorted by the x column
+        expected = prepared_history[prepared_history['competitorid'] == competitorid].sort_values('listyear', kind='stable')
+        pd.testing.assert_frame_equal(trajectories.get(competitorid), expected)
+        for col_name, x in (('slpos', 'fisyearathlete'), ('dhpos', 'athleteage')):
+            baseline = expected[[x, col_name]].rename(columns={x: 'fisyear'}).sort_values(by='fisyear', kind='stable')
+            pd.testing.assert_frame_equal(trajectories.positions(competitorid, col_name, x), baseline.reset_index(drop=True))
@@ -1,11 +1,239 @@
+import numpy as np
 import pandas as pd
 
+
+def sorted_by(df, keys):
+    """
+    ``df`` sorted by ``keys`` with a fresh RangeIndex; ``df`` itself (no copy) if it already is,
+    e.g. the memory-mapped history of mapped.py.
+    """
+    if isinstance(df.index, pd.RangeIndex) and df.index.start == 0 and df.index.step == 1 \
+            and pd.MultiIndex.from_frame(df[keys]).is_monotonic_increasing:
+        return df
+    return df.sort_values(keys, kind='stable').reset_index(drop=True)
+
+
+class CohortIndex:
+    """
+    History sorted by (gender, birthyear, listyear) together with the row range of every cohort.
+    A cohort is fetched with one dict lookup and a slice instead of a boolean scan over the
+    whole history. Build it once per dataset and pass it to the collect_data* functions in
+    place of combined_df. An optional CohortCube (cube.py) serves precomputed results.
+    """
+    KEYS = ['gender', 'birthyear', 'listyear']
+
+    def __init__(self, combined_df, cube=None):
+        self.cube = cube
+        self.frame = sorted_by(combined_df, self.KEYS)
+        groups = self.frame.groupby(self.KEYS, observed=True, sort=False, dropna=False).indices
+        self.offsets = {key: (rows[0], rows[-1] + 1) for key, rows in groups.items()}
+
+    def get(self, gender, birthyear, listyear):
+        start, stop = self.offsets.get((gender, birthyear, listyear), (0, 0))
+        return self.frame.iloc[start:stop]
+
+
+class TrajectoryIndex:
+    """
+    Row order of the history by (competitorid, listyear) together with the range of every athlete
+    in it, so the trajectory of one athlete is a take proportional to its number of seasons
+    instead of a comparison over the whole competitorid column. The history itself is not
+    copied or re-sorted. Rows without a competitorid belong to no trajectory. Build it once per dataset.
+    """
+    KEYS = ['competitorid', 'listyear']
+
+    def __init__(self, combined_df):
+        self.frame = combined_df
+        rows = np.flatnonzero(combined_df['competitorid'].notna().to_numpy())
+        ids = combined_df['competitorid'].to_numpy(dtype=np.int64, na_value=0)[rows]
+        by_athlete = np.lexsort((combined_df['listyear'].to_numpy()[rows], ids))
+        self.order, ids = rows[by_athlete], ids[by_athlete]
+        starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]]) if len(ids) else np.array([], dtype=int)
+        stops = np.r_[starts[1:], len(ids)]
+        self.offsets = dict(zip(ids[starts].tolist(), zip(starts.tolist(), stops.tolist())))
+
+    def get(self, competitorid):
+        start, stop = self.offsets.get(competitorid, (0, 0))
+        return self.frame.take(self.order[start:stop])
+
+    def positions(self, competitorid, col_name, x='fisyearathlete'):
+        """
+        Seasons of one athlete as a DataFrame with the columns fisyear (taken from ``x``) and ``col_name``.
+        """
+        start, stop = self.offsets.get(competitorid, (0, 0))
+        rows = self.order[start:stop]
+        return pd.DataFrame({'fisyear': self.frame[x].array[rows], col_name: self.frame[col_name].array[rows]})
+
+
+def get_cohort(combined_df, birthyear, season, Gender):
+    if isinstance(combined_df, CohortIndex):
+        return combined_df.get(Gender, birthyear, season)
+    return combined_df[(combined_df['birthyear'] == birthyear) &
+                       (combined_df['listyear'] == season) &
+                       (combined_df['gender'] == Gender)]
+
+def get_cohorts(combined_df, cohorts, Gender):
+    """
+    Rows of all (birthyear, season) cohorts of one gender.
+    """
+    if isinstance(combined_df, CohortIndex):
+        frames = [combined_df.get(Gender, birthyear, season) for birthyear, season in cohorts]
+        return pd.concat(frames) if frames else combined_df.frame.iloc[0:0]
+    keys = pd.MultiIndex.from_frame(combined_df[['birthyear', 'listyear']].astype('int64'))
+    mask = keys.isin(pd.MultiIndex.from_tuples(cohorts)) & (combined_df['gender'] == Gender).to_numpy()
+    return combined_df[mask]
+
+
+def _sorted_positions(df_cohorts, disciplin, group_keys, extra):
+    """
+    Ranked rows (position not NA) of ``df_cohorts`` sorted by ``group_keys`` and position,
+    with the sizes and start offsets of every group.
+    """
+    col_name = str(disciplin).lower() + 'pos'
+    df = pd.DataFrame({
+        'birthyear': df_cohorts['birthyear'].astype('int64').to_numpy(),
+        'listyear': df_cohorts['listyear'].astype('int64').to_numpy(),
+        'pos': df_cohorts[col_name].astype('float64').to_numpy(),
+        **extra,
+    }).dropna(subset=['pos'])
+    df = df.sort_values(group_keys + ['pos'], kind='stable')
+    sizes = df.groupby(group_keys, sort=False).size()
+    counts = sizes.to_numpy()
+    starts = np.cumsum(counts) - counts
+    return df, sizes, counts, starts
+
+
+def topX_means_by_cohort(df_cohorts, disciplin, tops, nation='SUI'):
+    """
+    Mean position of the top k ``nation`` (meansui) and other (meanint) athletes of every
+    (birthyear, listyear) cohort in ``df_cohorts``, for every k in ``tops``.
+    Each nation group is sorted once; every k is then read off a cumulative sum.
+    Returns a DataFrame indexed by (birthyear, listyear) with columns (meanint|meansui, top).
+    """
+    tops = list(tops)
+    is_nation = (df_cohorts['nationcode'] == nation).to_numpy(dtype=bool)
+    df, sizes, counts, starts = _sorted_positions(df_cohorts, disciplin, ['birthyear', 'listyear', 'sui'], {'sui': is_nation})
+    cumsum = np.concatenate([[0.0], np.cumsum(df['pos'].to_numpy())])
+
+    n = np.minimum(np.asarray(tops)[None, :], counts[:, None])
+    with np.errstate(invalid='ignore'):
+        means = (cumsum[starts[:, None] + n] - cumsum[starts[:, None]]) / n
+    wide = pd.DataFrame(means, index=sizes.index, columns=tops).unstack('sui')
+    wide = wide.reindex(columns=pd.MultiIndex.from_product([tops, [False, True]]))
+    wide.columns = pd.MultiIndex.from_tuples(
+        [('meansui' if sui else 'meanint', top) for top, sui in wide.columns]
+    )
+    return wide
+
+
+def nation_counts_by_cohort(df_cohorts, disciplin, thresholds, nation='SUI'):
+    """
+    Number of ``nation`` athletes among the best N ranked athletes of every (birthyear, listyear)
+    cohort in ``df_cohorts``, for every N in ``thresholds``.
+    Returns a DataFrame indexed by (birthyear, listyear) with one column per threshold.
+    """
+    thresholds = list(thresholds)
+    is_nation = (df_cohorts['nationcode'] == nation).to_numpy(dtype=bool)
+    df, sizes, counts, starts = _sorted_positions(df_cohorts, disciplin, ['birthyear', 'listyear'], {'sui': is_nation})
+    cumulative = np.concatenate([[0], np.cumsum(df['sui'].to_numpy())])
+
+    n = np.minimum(np.asarray(thresholds)[None, :], counts[:, None])
+    nation_counts = cumulative[starts[:, None] + n] - cumulative[starts[:, None]]
+    return pd.DataFrame(nation_counts, index=sizes.index, columns=thresholds)
+
+
+def mean_topX(combined_df, cohorts, Gender, tops, disciplines, nation='SUI'):
+    """
+    Mean position of the top k athletes of every cohort, for all ``tops`` (k values) and
+    ``disciplines`` in one pass, split into ``nation`` and all other nations (Int).
+    Cells available in the materialized cube of a CohortIndex (see cube.py) are looked up,
+    the remaining cohorts are computed live.
+
+    Returns a long DataFrame with the columns birthyear, season, disciplin, top, meanint, meansui.
+    """
+    cube = getattr(combined_df, 'cube', None)
+    results = []
+    for disciplin in disciplines:
+        missing = cohorts
+        if cube is not None and nation == 'SUI':
+            found, missing = cube.mean_topX(Gender, disciplin, cohorts, tops)
+            results.append(found)
+        if not missing:
+            continue
+
+        df_cohorts = get_cohorts(combined_df, missing, Gender)
+        wide = topX_means_by_cohort(df_cohorts, disciplin, tops, nation)
+        wide = wide.reindex(pd.MultiIndex.from_tuples(missing, names=['birthyear', 'listyear']))
+        for top in tops:
+            results.append(pd.DataFrame({
+                'birthyear': wide.index.get_level_values('birthyear'),
+                'season': wide.index.get_level_values('listyear'),
+                'disciplin': disciplin,
+                'top': top,
+                'meanint': wide[('meanint', top)].to_numpy(),
+                'meansui': wide[('meansui', top)].to_numpy(),
+            }))
+    return pd.concat(results, ignore_index=True)
+
+
+def _select_means(table, disciplin, top, cohorts):
+    """
+    Rows of one discipline and top k from a mean_topX table, in cohort order.
+    """
+    df = table[(table['disciplin'] == disciplin) & (table['top'] == top)]
+    df = df.set_index(['birthyear', 'season']).reindex(pd.MultiIndex.from_tuples(cohorts, names=['birthyear', 'season']))
+    return df.reset_index()[['birthyear', 'season', 'meanint', 'meansui']]
+
+
+def collect_data_grid(cohorts_by_key, Gender, tops, disciplines, combined_df):
+    """
+    Many collect_data* results from one mean_topX pass over the union of their cohorts.
+    ``cohorts_by_key`` maps any key to a cohort list; returns {(key, disciplin, top): DataFrame}.
+    """
+    cohorts = list(dict.fromkeys(cohort for cohort_list in cohorts_by_key.values() for cohort in cohort_list))
+    table = mean_topX(combined_df, cohorts, Gender, tops, disciplines)
+    # Row of every (disciplin, top, birthyear, season) with a NaN row appended for missing cells
+    rows = {key: i for i, key in enumerate(zip(table['disciplin'], table['top'], table['birthyear'], table['season']))}
+    meanint = np.append(table['meanint'].to_numpy(dtype='float64'), np.nan)
+    meansui = np.append(table['meansui'].to_numpy(dtype='float64'), np.nan)
+
+    results = {}
+    for key, cohort_list in cohorts_by_key.items():
+        birthyears = [birthyear for birthyear, _ in cohort_list]
+        seasons = [season for _, season in cohort_list]
+        for disciplin in disciplines:
+            for top in tops:
+                index = [rows.get((disciplin, top, birthyear, season), len(table)) for birthyear, season in cohort_list]
+                results[(key, disciplin, top)] = pd.DataFrame({
+                    'birthyear': birthyears,
+                    'season': seasons,
+                    'meanint': meanint[index],
+                    'meansui': meansui[index],
+                })
+    return results
+
+
+def cohorts_over_birthyears(birthyear, FISYear):
+    """
+    11 consecutive birthyears, each in its FIS year ``FISYear``.
+    """
+    return [(birthyear + i, birthyear + i + 16 + FISYear) for i in range(11)]
+
+
+def cohorts_over_seasons(birthyear, FISYear):
+    """
+    One birthyear over 11 consecutive seasons, starting in FIS year ``FISYear``.
+    """
+    season = birthyear + 16 + FISYear
+    return [(birthyear, season + i) for i in range(11)]
+
+
 def getMeanTopX_Int(df_season, disciplin, top):
     col_name = str(disciplin).lower() + 'pos'
     df_Int = df_season[df_season['nationcode'] != 'SUI']
     df_Int = df_Int.sort_values(by=col_name, ascending=True)
     df_Int = df_Int.head(top)
-    mean_dhpos = df_Int[col_name].mean()
+    mean_dhpos = df_Int[col_name].astype('float64').mean()
     return mean_dhpos
 
 def getMeanTopX_SUI(df_season, disciplin, top):
@@ -13,67 +241,198 @@ def getMeanTopX_SUI(df_season, disciplin, top):
     df_SUI = df_season[df_season['nationcode'] == 'SUI']
     df_SUI = df_SUI.sort_values(by=col_name, ascending=True)
     df_SUI = df_SUI.head(top)
-    mean_dhpos = df_SUI[col_name].mean()
+    mean_dhpos = df_SUI[col_name].astype('float64').mean()
     return mean_dhpos
 
-def getNoTopX_SUI(df_season, disciplin):
+def getNoTopX(df_season, disciplin, thresholds=(30, 50, 70), nation='SUI'):
+    """
+    Number of ``nation`` athletes among the best N of the season for every N in ``thresholds``.
+    The season is sorted once, every threshold is a lookup into the cumulative count.
+    Athletes without a position in the discipline are not ranked.
+    """
     col_name = str(disciplin).lower() + 'pos'
-    df_season = df_season.sort_values(by=col_name, ascending=True)
-    count_SUI_TOP30 = df_season.head(30)[df_season['nationcode'] == 'SUI'].shape[0]
-    count_SUI_TOP50 = df_season.head(50)[df_season['nationcode'] == 'SUI'].shape[0]
-    count_SUI_TOP70 = df_season.head(70)[df_season['nationcode'] == 'SUI'].shape[0]
+    pos = df_season[col_name].astype('float64').to_numpy()
+    ranked = ~np.isnan(pos)
+    order = np.argsort(pos[ranked], kind='stable')
+    is_nation = (df_season['nationcode'] == nation).to_numpy(dtype=bool)[ranked][order]
+    cumulative = np.concatenate([[0], np.cumsum(is_nation)])
+    return [int(cumulative[min(top, len(order))]) for top in thresholds]
+
+def getNoTopX_SUI(df_season, disciplin):
+    count_SUI_TOP30, count_SUI_TOP50, count_SUI_TOP70 = getNoTopX(df_season, disciplin, (30, 50, 70))
     return count_SUI_TOP30, count_SUI_TOP50, count_SUI_TOP70
 
 def collect_data(birthyear, FISYear, Gender, top, disciplin, combined_df):
-    data = []
-    for i in range(11):
-        season = birthyear + 16 + FISYear
-        df_season = combined_df[(combined_df['birthyear'] == birthyear) &
-                                (combined_df['listyear'] == season) &
-                                (combined_df['gender'] == Gender)]
-        MeanInt = getMeanTopX_Int(df_season, disciplin, top)
-        MeanSUI = getMeanTopX_SUI(df_season, disciplin, top)
-        data.append({
-            'birthyear': birthyear,
-            'season': season,
-            'meanint': MeanInt,
-            'meansui': MeanSUI
-        })
-        birthyear += 1
-    return pd.DataFrame(data)
+    return collect_data_tops(birthyear, FISYear, Gender, [top], disciplin, combined_df)[top]
+
+def collect_data_tops(birthyear, FISYear, Gender, tops, disciplin, combined_df):
+    """
+    collect_data for several top k values at once, returns {top: DataFrame}.
+    """
+    cohorts = cohorts_over_birthyears(birthyear, FISYear)
+    table = mean_topX(combined_df, cohorts, Gender, tops, [disciplin])
+    return {top: _select_means(table, disciplin, top, cohorts) for top in tops}
+
+def collect_data_No(birthyear, FISYear, Gender, disciplin, combined_df, thresholds=(30, 50, 70), nation='SUI'):
+    cube = getattr(combined_df, 'cube', None)
+    if cube is not None and nation == 'SUI':
+        df_cube = cube.collect_data_No(birthyear, FISYear, Gender, disciplin, thresholds)
+        if df_cube is not None:
+            return df_cube
 
-def collect_data_No(birthyear, FISYear, Gender, disciplin, combined_df):
     data = []
     for i in range(11):
         season = birthyear + 16 + FISYear
-        df_season = combined_df[(combined_df['birthyear'] == birthyear) &
-                                (combined_df['listyear'] == season) &
-                                (combined_df['gender'] == Gender)]
-        SUI_TOP30, SUI_TOP50, SUI_TOP70 = getNoTopX_SUI(df_season, disciplin)
-        data.append({
+        df_season = get_cohort(combined_df, birthyear, season, Gender)
+        counts = getNoTopX(df_season, disciplin, thresholds, nation)
+        row = {
             'birthyear': birthyear,
             'season': season,
-            'top30': SUI_TOP30,
-            'top50': SUI_TOP50,
-            'top70': SUI_TOP70
-        })
+        }
+        row.update({f'top{top}': count for top, count in zip(thresholds, counts)})
+        data.append(row)
         birthyear += 1
     return pd.DataFrame(data)
 
 def collect_data_Entw(birthyear, FISYear, Gender, top, disciplin, combined_df):
-    data = []
-    season = birthyear + 16 + FISYear
-    for i in range(11):
-        df_season = combined_df[(combined_df['birthyear'] == birthyear) &
-                                (combined_df['listyear'] == season) &
-                                (combined_df['gender'] == Gender)]
-        MeanInt = getMeanTopX_Int(df_season, disciplin, top)
-        MeanSUI = getMeanTopX_SUI(df_season, disciplin, top)
-        data.append({
-            'birthyear': birthyear,
-            'season': season,
-            'meanint': MeanInt,
-            'meansui': MeanSUI
-        })
-        season += 1
-    return pd.DataFrame(data)
+    return collect_data_Entw_disciplines(birthyear, FISYear, Gender, top, [disciplin], combined_df)[disciplin]
+
+def collect_data_Entw_disciplines(birthyear, FISYear, Gender, top, disciplines, combined_df):
+    """
+    collect_data_Entw for several disciplines at once, returns {disciplin: DataFrame}.
+    """
+    cohorts = cohorts_over_seasons(birthyear, FISYear)
+    table = mean_topX(combined_df, cohorts, Gender, [top], disciplines)
+    return {disciplin: _select_means(table, disciplin, top, cohorts) for disciplin in disciplines}
+
+def top_table(data, discipline, n=3):
+    """
+    Best ``n`` athletes of ``data`` in ``discipline`` (e.g. "sl") as display table
+    with the columns Name, Nat, Best, Rank and an index starting at 1.
+    """
+    pos = discipline + "pos"
+
+    df_filtered = data.dropna(subset=[pos])
+    # Stable: athletes with the same position keep their order in the list, as in RankingIndex
+    df_filtered = df_filtered.sort_values(by=pos, ascending=True, kind='stable')
+    return _display_table(df_filtered.head(n), discipline)
+
+# Marker of the SUI rows, shown in place of the Styler highlight in large tables
+SUI_MARKER = "🟦"
+
+def _display_table(df_topX, discipline):
+    pos = discipline + "pos"
+    points = discipline + "points"
+
+    # Format the table
+    df_topX_display = df_topX.rename(columns={
+        "competitorname": "Name",
+        "nationcode": "Nat",
+        points: "Best",
+        pos: "Rank"
+    })[["Name", "Nat", "Best", "Rank"]]
+    # Computed with the table, so a cached table is shown as it is
+    df_topX_display.insert(0, "SUI", np.where(df_topX_display["Nat"].to_numpy() == "SUI", SUI_MARKER, ""))
+
+    # Reset the index
+    df_topX_display.reset_index(drop=True, inplace=True)
+    df_topX_display.index += 1  # Start index at 1
+    return df_topX_display
+
+class RankingIndex:
+    """
+    Latest list pre-sorted by position for every discipline, with birthyear, gender and nation
+    arrays aligned to that order; athletes with the same position keep their order in the list,
+    as in top_table. The ranked rows are also kept stably sorted by gender, nation and both, so
+    the rows of a gender and/or nation are one slice (searchsorted), still in rank order. A top N
+    query walks that slice in chunks and stops at N instead of masking every row.
+    Build it once per loaded list.
+    """
+    DISCIPLINES = ["sl", "gs", "sg", "dh"]
+
+    def __init__(self, data):
+        self.data = data.reset_index(drop=True)
+        self.order = {}
+        self.birthyear = {}
+        self.gender = {}
+        self.nation = {}
+        self.by_key = {}
+        self.genders = np.unique(self.data["gender"].astype(str).to_numpy())
+        self.nations = np.unique(self.data["nationcode"].astype(str).to_numpy())
+        for discipline in self.DISCIPLINES:
+            pos = self.data[discipline + "pos"]
+            ranked = pos.notna().to_numpy()
+            order = np.flatnonzero(ranked)[np.argsort(pos[ranked].to_numpy(), kind='stable')]
+            self.order[discipline] = order
+            self.birthyear[discipline] = self.data["birthyear"].to_numpy()[order]
+            self.gender[discipline] = self.data["gender"].astype(str).to_numpy()[order]
+            self.nation[discipline] = self.data["nationcode"].astype(str).to_numpy()[order]
+            gender_codes = np.searchsorted(self.genders, self.gender[discipline])
+            nation_codes = np.searchsorted(self.nations, self.nation[discipline])
+            keys = {
+                'gender': gender_codes,
+                'nation': nation_codes,
+                'both': gender_codes * len(self.nations) + nation_codes,
+            }
+            self.by_key[discipline] = {}
+            for name, key in keys.items():
+                ranks = np.argsort(key, kind='stable')
+                self.by_key[discipline][name] = (key[ranks], ranks)
+
+    def _candidates(self, discipline, gender, nation):
+        """
+        Ranks (positions in the sorted order) of the rows of ``gender`` and ``nation``, ascending.
+        """
+        if gender is None and nation is None:
+            return np.arange(len(self.order[discipline]))
+        codes = {}
+        for name, value, values in (('gender', gender, self.genders), ('nation', nation, self.nations)):
+            if value is not None:
+                code = np.searchsorted(values, value)
+                if code == len(values) or values[code] != value:
+                    return np.arange(0)
+                codes[name] = code
+        if len(codes) == 2:
+            name, value = 'both', codes['gender'] * len(self.nations) + codes['nation']
+        else:
+            (name, value), = codes.items()
+        keys, ranks = self.by_key[discipline][name]
+        return ranks[np.searchsorted(keys, value, 'left'):np.searchsorted(keys, value, 'right')]
+
+    def top_rows(self, discipline, n, birthyears=None, gender=None, nation=None):
+        """
+        Row numbers of the best ``n`` athletes in ``discipline``, optionally restricted to a
+        (from, to) ``birthyears`` range, a gender and a nation.
+        """
+        candidates = self._candidates(discipline, gender, nation)
+        if birthyears is None:
+            return self.order[discipline][candidates[:n]]
+        birthyear = self.birthyear[discipline]
+        low, high = min(birthyears), max(birthyears)
+        found, count, start, chunk = [], 0, 0, max(4 * n, 64)
+        while count < n and start < len(candidates):
+            ranks = candidates[start:start + chunk]
+            years = birthyear[ranks]
+            hits = ranks[(years >= low) & (years <= high)][:n - count]
+            found.append(hits)
+            count += len(hits)
+            start += chunk
+            chunk *= 2
+        return self.order[discipline][np.concatenate(found) if found else candidates[:0]]
+
+    def top_table(self, discipline, n=3, birthyears=None, gender=None, nation=None):
+        """
+        Same table as top_table(data, discipline, n) for the filtered list.
+        """
+        rows = self.top_rows(discipline, n, birthyears, gender, nation)
+        return _display_table(self.data.iloc[rows], discipline)
+
+def calculate_statistics(fisyear_pos, col_name):
+    """
+    Helper function to calculate mean, standard deviation, and bounds.
+    The lower bound is clamped at 0 to avoid negative position values.
+    """
+    df_grouped = fisyear_pos.groupby('fisyear')[col_name].agg(['mean', 'std']).reset_index()
+    df_grouped['upper'] = df_grouped['mean'] + df_grouped['std']
+    df_grouped['lower'] = (df_grouped['mean'] - df_grouped['std']).clip(lower=0)
+    return df_grouped
@@ -0,0 +1,50 @@
+"""
+"Year of birth over seasons" and "Year of birth Development over Seasons" pages: matplotlib
+charts of the cohort series, rendered to PNG and cached per input by Analytics.chart_png.
+"""
+import streamlit as st
+
+from views.common import get_analytics
+
+
+def render_birthyear_page(data_version=None):
+
+    # User inputs
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        birthyear = st.number_input("Enter birth year:", value=1998, min_value=1994, max_value=2011)
+    
+    with col2:
+        FISYear = st.number_input("Enter FIS Year:", value=1, min_value=1, max_value=5)
+    
+    with col3:
+        Gender = st.selectbox("Select Gender:", options=['M', 'W'])
+    
+    with col4:
+        disciplin = st.selectbox("Select Discipline:", options=['DH', 'SL', 'GS', 'SG', 'AC'])
+
+    # Rendered chart, cached per input
+    st.image(get_analytics(data_version).chart_png('birthyear_over_seasons', birthyear, FISYear, Gender, disciplin),
+             use_container_width=True)
+
+
+def render_development_page(data_version=None):
+
+
+    # User inputs
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        birthyear = st.number_input("Enter birth year:", value=1998, min_value=1994, max_value=2011)
+    
+    with col2:
+        Gender = st.selectbox("Select Gender:", options=['M', 'W'])
+
+    with col3:
+        top = st.number_input("Select Top X:", value=10, min_value=3, max_value=50)
+
+    FISYear = 1
+    # Rendered chart, cached per input
+    st.image(get_analytics(data_version).chart_png('development_over_seasons', birthyear, FISYear, Gender, top),
+             use_container_width=True)
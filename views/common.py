@@ -0,0 +1,108 @@
+"""
+Data access and table helpers shared by the pages. Imports only Streamlit, pandas and the
+headless analytics, so it adds nothing to the cold start of the table pages.
+"""
+import threading
+
+import pandas as pd
+import streamlit as st
+
+from analytics import Analytics, history_version as analytics_history_version
+from instrumentation import stage
+
+# The pages derive their frames from the read-only shared history (shared.py): with copy-on-write
+# those selections share its memory until written. Set once per server process, for the app only.
+pd.set_option("mode.copy_on_write", True)
+
+### PATHS ###
+path_latest_fis_list_combinded = "FIS_List_Dashboard/data/fis_list_combined"
+path_latest_fis_list_combinded_pkl = "FIS_List_Dashboard/data/fis_list_combined_1_05_25.pkl"
+path_latest_fis_list = "FIS_List_Dashboard/data/FIS-points-list-AL-2025-413.csv"
+
+### HELPER FUNCTIONS ###
+# Data and results come from the headless analytics.py: one Analytics per history version,
+# shared by all sessions; series precomputed with `python analytics.py` are read from disk.
+@st.cache_resource(show_spinner=False, max_entries=1)
+def get_analytics(data_version=None):
+    return Analytics(path_latest_fis_list_combinded, path_latest_fis_list, path_latest_fis_list_combinded_pkl)
+
+def history_version():
+    """
+    Version token of the history, read once per script run by app.py and passed to the page.
+    """
+    return analytics_history_version(path_latest_fis_list_combinded, path_latest_fis_list_combinded_pkl)
+
+def get_latest_fis_list(data_version=None):
+    return get_analytics(data_version).latest()
+
+def load_prepared_data(columns=None, gender=None, data_version=None):
+    """
+    Combined FIS history with the typed and derived columns of prepare.py, only the requested
+    columns and gender, loaded once per data version. Shared read-only, not copied per call.
+    """
+    combined_df = get_analytics(data_version).prepared(columns, gender)
+    if combined_df is None:
+        st.error(f"FIS history not found at {path_latest_fis_list_combinded}")
+    return combined_df
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def start_warm_up(data_version=None):
+    """
+    Load the data and cache the default view of every page in a background thread, once per
+    data version (the first script run after a start or a data update). Step timings are
+    printed to the server log and kept in Analytics.warm_up_timings.
+    The thread only fills the caches of Analytics (charts included), it makes no Streamlit calls
+    and needs no script run context.
+    """
+    analytics = get_analytics(data_version)
+    thread = threading.Thread(target=analytics.warm_up, name="warm-up", daemon=True)
+    thread.start()
+    return thread
+
+def highlight_suiss(val):
+    if val == "SUI":
+        return 'background-color: rgba(0, 102, 255, 0.8)'
+    return ''
+
+def formated_dataframe(df, n, column_config=None):
+    height = 750 if n == 20 else None
+    df_formated = st.dataframe(
+        df,
+        use_container_width=True,
+        height=height,
+        column_config={
+            "Name": st.column_config.Column(width=150),
+            **(column_config or {})
+        }
+    )
+    return df_formated
+
+# Above this many rows the Styler (one Python callback and one CSS rule per cell) is replaced by
+# the SUI marker column of the table (utils.SUI_MARKER) and native column formatting of st.dataframe
+STYLER_MAX_ROWS = 50
+
+def show_table(df_topX_display, n=3, style=False):
+    if style and len(df_topX_display) > STYLER_MAX_ROWS:
+        with stage("table (column config)"):
+            return formated_dataframe(df_topX_display, n, column_config={
+                "SUI": st.column_config.TextColumn("SUI", width="small"),
+                "Rank": st.column_config.NumberColumn(format="%d"),
+                "Best": st.column_config.NumberColumn(format="%.2f"),
+            })
+
+    # Short tables highlight Nat instead
+    df_topX_display = df_topX_display.drop(columns="SUI")
+    if style:
+        styled_df = (df_topX_display.style
+                    .map(highlight_suiss, subset=['Nat'])
+                    .format({
+                        "Rank": "{:.0f}",   # No decimal places
+                        "Best": "{:.2f}"    # Two decimal places
+                    })
+                )
+        with stage("table (styler)"):
+            return formated_dataframe(styled_df, n)
+
+    # Display the table in Streamlit
+    with stage("table"):
+        return formated_dataframe(df_topX_display, n)
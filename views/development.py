@@ -0,0 +1,374 @@
+"""
+"Current Top Athletes - Development" and "Athlete - All Disciplines - Development" pages: plotly
+charts of the position of athletes over their FIS years or age against the mean of the top X.
+"""
+import plotly.graph_objects as go
+import streamlit as st
+
+from analytics import DEVELOPMENT_COLUMNS
+from instrumentation import stage
+from views.common import get_analytics, get_latest_fis_list, load_prepared_data
+
+
+def plot_fisyear_data(fig, df_grouped, comp_data, competitor_name, col_name, disciplin, use_log_scale):
+    """
+    Helper function to add traces to the plot for grouped data and competitor-specific data.
+    """
+    # Plot the mean line
+    fig.add_trace(go.Scatter(
+        name='Mean',
+        x=df_grouped['fisyear'],
+        y=df_grouped['mean'],
+        mode='lines+markers',
+        line=dict(color='blue')
+    ))
+    # Plot the upper bound (invisible, for fill)
+    fig.add_trace(go.Scatter(
+        name='Upper Bound',
+        x=df_grouped['fisyear'],
+        y=df_grouped['upper'],
+        mode='lines',
+        line=dict(width=0),
+        showlegend=False
+    ))
+    # Plot the lower bound and fill to the previous trace
+    fig.add_trace(go.Scatter(
+        name='Lower Bound',
+        x=df_grouped['fisyear'],
+        y=df_grouped['lower'],
+        mode='lines',
+        line=dict(width=0),
+        fill='tonexty',
+        fillcolor='rgba(0, 0, 255, 0.2)',
+        showlegend=False
+    ))
+
+    # Add competitor-specific data as a separate trace
+    if not comp_data.empty:
+        fig.add_trace(go.Scatter(
+            name=competitor_name,
+            x=comp_data['fisyear'],
+            y=comp_data[col_name],
+            mode='lines+markers',
+            marker=dict(color='red', size=10),
+            line=dict(color='red', dash='dash')
+        ))
+
+    # Update layout with the toggle for logarithmic scale
+    fig.update_layout(
+        title=f"{disciplin} Position vs FIS Year Athlete (with Std)",
+        xaxis_title='FIS Year Athlete',
+        yaxis_title=f"{disciplin} Position",
+        yaxis_autorange='reversed',
+        yaxis_type="log" if use_log_scale else "linear"
+    )
+    return fig
+
+
+def render_top_athletes_page(data_version=None):
+    st.markdown("<h3><span style='color:blue;'>TopX</span><span style='color:#4a0a13;'> vs Swiss</span></h3>", unsafe_allow_html=True)
+  
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        Gender = st.selectbox("Select Gender:", options=['M', 'W'], index=0)
+    with col2:
+        top = st.number_input("Select Top X:", value=30, min_value=10, max_value=100)
+    with col3:
+        # Add a dropdown menu to select the discipline
+        disciplin = st.selectbox("Select Discipline:", options=['DH', 'SG', 'SL', 'GS'])
+
+    # Load the data
+    combined_df = load_prepared_data(
+        columns=DEVELOPMENT_COLUMNS,
+        gender=Gender,
+        data_version=data_version,
+    )
+    trajectories = get_analytics(data_version).trajectories(Gender)
+    df_FIS_list = get_latest_fis_list(data_version)
+
+    # Filter the FIS list DataFrame for the selected gender and "nationcode" SUI
+    df_FIS_list = df_FIS_list[
+        (df_FIS_list["gender"].str.upper() == Gender.upper()) & 
+        (df_FIS_list["nationcode"] == "SUI")
+    ]
+
+    # Filter combined_df for SUI athletes
+    combined_df_sui = combined_df[
+        (combined_df["nationcode"] == "SUI") & (combined_df["gender"].str.upper() == Gender.upper())
+    ]
+
+    # Determine the column name based on discipline (e.g., 'dhpos', 'sgpos', etc.)
+    col_name = f"{disciplin.lower()}pos"
+
+    # Get the top X athletes from the FIS list DataFrame for this discipline
+    df_topX = df_FIS_list.nsmallest(top, col_name)[["competitorid", "competitorname"]]
+
+    # Mean and band of the top X, memoized independently of the selected athletes
+    df_grouped = get_analytics(data_version).band_statistics(Gender, disciplin, top, "fisyearathlete", "SUI")
+
+    # Athlete selection and plot rerun on their own, the top X data above is not reloaded
+    @st.fragment
+    def top_athletes_plot(df_grouped, df_topX, combined_df_sui, trajectories, top, disciplin, col_name):
+        # Combine competitor selections from top X and from SUI filtered data
+        # Athletes without a competitorid have no trajectory to plot
+        competitors_topX = df_topX.dropna(subset=["competitorid"]).drop_duplicates(subset=["competitorid"])
+        competitors_sui = combined_df_sui[['competitorid', 'competitorname']].dropna(subset=["competitorid"]).drop_duplicates()
+
+        competitor_mapping_topX = competitors_topX.set_index("competitorid")["competitorname"].to_dict()
+        competitor_mapping_sui = competitors_sui.set_index("competitorid")["competitorname"].to_dict()
+
+        # Add toggle for logarithmic scale
+        use_log_scale = st.checkbox("Use Logarithmic Scale for Y-Axis", value=False)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            selected_competitor_topX = st.selectbox(
+                f"Select Athlete from Top {top} ({disciplin})",
+                list(competitor_mapping_topX.keys()),
+                format_func=lambda cid: competitor_mapping_topX[cid]
+            )
+        with col2:
+            selected_competitor_sui = st.selectbox(
+                f"Select SUI Athlete ({disciplin})",
+                list(competitor_mapping_sui.keys()),
+                format_func=lambda cid: competitor_mapping_sui[cid]
+            )
+
+        # Get competitor-specific data for SUI and for top X
+        comp_data_sui = trajectories.positions(selected_competitor_sui, col_name)
+
+        comp_data_topX = trajectories.positions(selected_competitor_topX, col_name).dropna(subset=[col_name])
+
+        # Create a line plot and add traces using the helper function for top X data
+        fig = go.Figure()
+        fig = plot_fisyear_data(
+            fig=fig,
+            df_grouped=df_grouped,
+            comp_data=comp_data_topX,
+            competitor_name=competitor_mapping_topX[selected_competitor_topX],
+            col_name=col_name,
+            disciplin=disciplin,
+            use_log_scale=use_log_scale
+        )
+
+        # Add trace for SUI competitor if available
+        if not comp_data_sui.empty:
+            fig.add_trace(go.Scatter(
+                name=f"{competitor_mapping_sui[selected_competitor_sui]} (SUI)",
+                x=comp_data_sui['fisyear'],
+                y=comp_data_sui[col_name],
+                mode='lines+markers',
+                marker=dict(color='gray', size=10),
+                line=dict(color='gray', dash='dash')
+            ))
+
+        with stage("plotly render"):
+            st.plotly_chart(fig)
+
+    top_athletes_plot(df_grouped, df_topX, combined_df_sui, trajectories, top, disciplin, col_name)
+
+
+def render_athlete_page(data_version=None):
+    st.markdown("<h3><span style='color:blue;'>TopX</span><span style='color:#4a0a13;'> vs Swiss</span></h3>", unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        Gender = st.selectbox("Select Gender:", options=['M', 'W'], index=0)
+    with col2:
+        top = st.number_input("Select Top X International:", value=30, min_value=10, max_value=100)
+
+    # Load the data
+    combined_df = load_prepared_data(
+        columns=DEVELOPMENT_COLUMNS,
+        gender=Gender,
+        data_version=data_version,
+    )
+    trajectories = get_analytics(data_version).trajectories(Gender)
+
+    # Instead of using 'fisyearathlete', use 'athleteage' (prepared in prepare.py)
+
+    # Filter combined_df for SUI athletes
+    combined_df_sui = combined_df[combined_df["nationcode"] == "SUI"]
+    combined_df_sui = combined_df_sui[combined_df_sui["gender"].str.upper() == Gender.upper()]
+
+    # Prepare competitor selection: only SUI athlete selection is needed (applies to all disciplines),
+    # athletes without a competitorid have no trajectory to plot
+    competitors_sui = combined_df_sui[['competitorid', 'competitorname']].dropna(subset=["competitorid"]).drop_duplicates()
+    competitor_mapping_sui = competitors_sui.set_index("competitorid")["competitorname"].to_dict()
+
+    # Mean position of the top X per discipline by athlete age, independent of the selected athletes
+    disciplines = ['DH', 'SG', 'SL', 'GS']
+    grouped_by_discipline = {
+        disciplin: get_analytics(data_version).band_statistics(Gender, disciplin, top, "athleteage", "SUI")
+        for disciplin in disciplines
+    }
+
+    # Athlete selection and plots rerun on their own, the top X statistics above are not recomputed
+    @st.fragment
+    def athlete_development_plots(trajectories, competitor_mapping_sui, grouped_by_discipline):
+        default_index = list(competitor_mapping_sui.values()).index("ODERMATT Marco") if "ODERMATT Marco" in competitor_mapping_sui.values() else 0
+        selected_competitor_sui = st.selectbox(
+            "Select SUI Athlete",
+            list(competitor_mapping_sui.keys()),
+            index=default_index,
+            format_func=lambda cid: competitor_mapping_sui[cid]
+        )
+        default_index = list(competitor_mapping_sui.values()).index("VON ALLMEN Franjo") if "VON ALLMEN Franjo" in competitor_mapping_sui.values() else 0
+        selected_competitor_sui2 = st.selectbox(
+            "Select another SUI Athlete",
+            list(competitor_mapping_sui.keys()),
+            format_func=lambda cid: competitor_mapping_sui[cid],
+            index=default_index,
+            key="second_competitor"
+        )
+
+        # Create a 2x2 grid for graphs
+        row1_col1, row1_col2 = st.columns(2)
+        row2_col1, row2_col2 = st.columns(2)
+        grid = [row1_col1, row1_col2, row2_col1, row2_col2]
+
+        # Define a color mapping for disciplines
+        color_map = {
+            'DH': {'line': 'rgb(255, 204, 0)', 'fill': 'rgba(255, 204, 0, 0.2)'},
+            'SG': {'line': 'green', 'fill': 'rgba(0,128,0,0.2)'},
+            'SL': {'line': 'blue', 'fill': 'rgba(0,0,255,0.2)'},
+            'GS': {'line': 'rgb(235, 52, 201)', 'fill': 'rgba(235, 52, 201, 0.2)'},
+        }
+
+        # ... inside the for loop for individual discipline plots ...
+        for idx, disciplin in enumerate(disciplines):
+            with grid[idx]:
+                st.markdown(f"### {disciplin} Position")
+                col_name = f"{disciplin.lower()}pos"
+                df_grouped = grouped_by_discipline[disciplin]
+
+                # Get competitor-specific data for first SUI athlete using athleteage
+                comp_data_sui = trajectories.positions(selected_competitor_sui, col_name, x='athleteage')
+
+                # Determine the color based on discipline
+                if disciplin in color_map:
+                    line_color = color_map[disciplin]['line']
+                    fill_color = color_map[disciplin]['fill']
+                else:
+                    line_color = 'blue'
+                    fill_color = 'rgba(0,0,255,0.2)'
+            
+                # Create a line plot with a normal (non-inverted) y-axis using athleteage for the x-axis
+                fig = go.Figure()
+                fig.add_trace(go.Scatter(
+                    name='Mean',
+                    x=df_grouped['fisyear'],
+                    y=df_grouped['mean'],
+                    mode='lines+markers',
+                    line=dict(color=line_color, width=4)
+                ))
+                fig.add_trace(go.Scatter(
+                    name='Upper Bound',
+                    x=df_grouped['fisyear'],
+                    y=df_grouped['upper'],
+                    mode='lines',
+                    line=dict(width=0, color=line_color),
+                    showlegend=False
+                ))
+                fig.add_trace(go.Scatter(
+                    name='Lower Bound',
+                    x=df_grouped['fisyear'],
+                    y=df_grouped['lower'],
+                    mode='lines',
+                    line=dict(width=0),
+                    fill='tonexty',
+                    fillcolor=fill_color,
+                    showlegend=False
+                ))
+                # Add trace for first SUI competitor (dashed lines)
+                if not comp_data_sui.empty:
+                    fig.add_trace(go.Scatter(
+                        name=f"{competitor_mapping_sui[selected_competitor_sui]} (SUI)",
+                        x=comp_data_sui['fisyear'],
+                        y=comp_data_sui[col_name],
+                        mode='lines+markers',
+                        marker=dict(color='gray', size=10),
+                        line=dict(color='gray', dash='dash')
+                    ))
+                # Get competitor-specific data for second SUI athlete using athleteage
+                comp_data_sui2 = trajectories.positions(selected_competitor_sui2, col_name, x='athleteage')
+                # Add trace for second SUI competitor (dotted lines)
+                if not comp_data_sui2.empty:
+                    fig.add_trace(go.Scatter(
+                        name=f"{competitor_mapping_sui[selected_competitor_sui2]} (SUI 2)",
+                        x=comp_data_sui2['fisyear'],
+                        y=comp_data_sui2[col_name],
+                        mode='lines+markers',
+                        marker=dict(color='rgb(40,40,40)', size=10, symbol='square'),
+                        line=dict(color='rgb(40,40,40)', dash='dot')
+                    ))
+            
+                fig.update_layout(
+                    title=f"{disciplin} Position vs Athlete Age",
+                    xaxis_title='Athlete Age',
+                    yaxis_title=f"{disciplin} Position",
+                    yaxis_type="linear"
+                )
+                with stage("plotly render"):
+                    st.plotly_chart(fig)
+
+        # --- Combined Plot (All Disciplines Mean Only) ---
+        fig_combined = go.Figure()
+        for disciplin in disciplines:
+            col_name = f"{disciplin.lower()}pos"
+            df_grouped = grouped_by_discipline[disciplin]
+
+            # Determine the color based on discipline
+            if disciplin in color_map:
+                line_color = color_map[disciplin]['line']
+            else:
+                line_color = 'blue'
+        
+            # Add trace for the discipline mean using athlete age for the x-axis
+            fig_combined.add_trace(go.Scatter(
+                name=f"{disciplin} Mean",
+                x=df_grouped['fisyear'],
+                y=df_grouped['mean'],
+                mode='lines+markers',
+                line=dict(color=line_color, width=2)
+            ))
+        
+            # Get competitor-specific data for SUI for the current discipline, using athleteage
+            comp_data_sui = trajectories.positions(selected_competitor_sui, col_name, x='athleteage')
+        
+            # Add trace for SUI competitor if data exists, with dashed line
+            if not comp_data_sui.empty:
+                fig_combined.add_trace(go.Scatter(
+                    name=f"{disciplin} {competitor_mapping_sui[selected_competitor_sui]} (SUI)",
+                    x=comp_data_sui['fisyear'],
+                    y=comp_data_sui[col_name],
+                    mode='lines+markers',
+                    marker=dict(size=10),
+                    line=dict(color=line_color, dash='dash')
+                ))
+
+            # Get competitor-specific data for second SUI athlete, using athleteage
+            comp_data_sui2 = trajectories.positions(selected_competitor_sui2, col_name, x='athleteage')
+
+            # Add trace for second SUI competitor with dotted line
+            if not comp_data_sui2.empty:
+                fig_combined.add_trace(go.Scatter(
+                    name=f"{disciplin} {competitor_mapping_sui[selected_competitor_sui2]} (SUI 2)",
+                    x=comp_data_sui2['fisyear'],
+                    y=comp_data_sui2[col_name],
+                    mode='lines+markers',
+                    marker=dict(size=10, symbol='square'),
+                    line=dict(dash='dot')
+                ))
+
+        fig_combined.update_layout(
+            title="Combined Mean Position vs Athlete Age (All Disciplines)",
+            xaxis_title="Athlete Age",
+            yaxis_title="Position",
+            yaxis_type="linear"
+        )
+
+        with stage("plotly render"):
+            st.plotly_chart(fig_combined)
+
+    athlete_development_plots(trajectories, competitor_mapping_sui, grouped_by_discipline)
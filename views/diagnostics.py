@@ -0,0 +1,33 @@
+"""
+Hidden diagnostics page (?diagnostics): rolling measurements of instrumentation.py.
+"""
+import pandas as pd
+import streamlit as st
+
+import instrumentation
+from views.common import get_analytics
+
+
+def render(data_version=None):
+    st.subheader("Diagnostics")
+    if not instrumentation.ENABLED:
+        st.info("Instrumentation is off. Start the app with FIS_DASHBOARD_INSTRUMENT=1 to record measurements.")
+
+    st.markdown(f"**Process RSS:** {instrumentation.rss_bytes() / 1e6:.0f} MB")
+    st.markdown(f"**Stage wall time (ms), last {instrumentation.WINDOW} measurements per stage**")
+    st.dataframe(instrumentation.timings_summary().style.format(precision=1), use_container_width=True)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown("**Cache hits and misses**")
+        st.dataframe(instrumentation.cache_summary(), use_container_width=True)
+        st.markdown("**Process RSS over reruns**")
+        st.dataframe(instrumentation.rss_summary().style.format(precision=0), use_container_width=True)
+    with col2:
+        st.markdown("**Loaded DataFrames**")
+        st.dataframe(instrumentation.memory_summary().style.format({"MB": "{:.1f}"}), use_container_width=True)
+        st.markdown("**Startup warm-up (s)**")
+        st.dataframe(pd.DataFrame(get_analytics(data_version).warm_up_timings, columns=["step", "seconds"]), use_container_width=True)
+
+    if st.button("Reset measurements"):
+        instrumentation.reset()
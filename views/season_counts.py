@@ -0,0 +1,76 @@
+"""
+"Year of birth and Season #" page: SUI athletes of a birthyear in the top X of each season.
+"""
+import matplotlib.pyplot as plt
+import streamlit as st
+
+from instrumentation import stage
+from views.common import get_analytics
+
+
+def render(data_version=None):
+
+  # User inputs
+    col1, col2, col3, col4 = st.columns(4)
+
+    with col1:
+        birthyear = st.number_input("Enter birth year:", value=1998, min_value=1994, max_value=2011)
+    
+    with col2:
+        FISYear = st.number_input("Enter FIS Year:", value=1, min_value=1, max_value=5)
+    
+    with col3:
+        Gender = st.selectbox("Select Gender:", options=['M', 'W'])
+    
+    with col4:
+        disciplin = st.selectbox("Select Discipline:", options=['DH', 'SL', 'GS', 'SG', 'AC'])
+
+    thresholds = st.multiselect(
+        "Select Top X thresholds:",
+        options=[10, 20, 30, 40, 50, 60, 70, 80, 90, 100, 150, 200],
+        default=[30, 50, 70],
+    )
+    thresholds = sorted(thresholds)
+    if not thresholds:
+        st.warning("Select at least one threshold.")
+        st.stop()
+
+    df_results_top = get_analytics(data_version).season_counts(birthyear, FISYear, Gender, disciplin, thresholds)
+
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.table(df_results_top.style.format(precision=0))
+
+    with col2:
+       
+        df_results_top['season'] = df_results_top['season'].astype(str).str[2:]
+        df_results_top['season'] = df_results_top['season'].apply(lambda x: f"{int(x)-1}/{int(x)}" if x.isdigit() else x)
+        df_results_top['season'] = "S" + df_results_top['season'].astype(str) + " BY" + df_results_top['birthyear'].astype(str)
+
+        # Create bar plot, one group of bars per threshold
+        colors = ['#F5921B', '#87BB62', '#876FD4', '#0328fc', '#4a0a13', '#E84A5F']
+        fig, ax = plt.subplots(figsize=(10, 6))
+        bar_width = 0.75 / len(thresholds)
+        index = range(len(df_results_top['season']))
+        for n, top in enumerate(thresholds):
+            color = colors[n % len(colors)]
+            bars = ax.bar([i + n * bar_width for i in index], df_results_top[f'top{top}'], bar_width, label=f'Top {top}', color=color)
+
+            # Add value labels on bars
+            for bar in bars:
+                height = bar.get_height()
+                ax.annotate(f'{height:.0f}', xy=(bar.get_x() + bar.get_width() / 2, height),
+                    xytext=(0, 3), textcoords="offset points", ha='center', va='bottom', color=color)
+
+        ax.set_xlabel('Season and Birth Year')
+        ax.set_ylabel('Count')
+        ax.set_title('Number of SUI Athletes in Top ' + ', '.join(str(top) for top in thresholds))
+        ax.set_xticks([i + bar_width * (len(thresholds) - 1) / 2 for i in index])
+        ax.set_xticklabels(df_results_top['season'], rotation=45)
+        ax.legend()
+        ax.grid(False)
+
+        with stage("matplotlib render"):
+            st.pyplot(fig)
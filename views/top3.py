@@ -0,0 +1,58 @@
+"""
+"Top 3" page: the best three of a birthyear per discipline in the latest list, overall and SUI.
+"""
+import streamlit as st
+
+from views.common import get_analytics, get_latest_fis_list, show_table
+
+DISCIPLINE_TITLES = {"sl": "Slalom", "gs": "Giant Slalom", "sg": "Super G", "dh": "Downhill"}
+
+@st.fragment
+def top3_block(birthyear_options, data_version, key_birthyear=None, key_gender=None):
+    """
+    Birthyear/gender selection with its 8 tables. Runs as a fragment: changing its selectors
+    reruns only this block, not the rest of the page.
+    """
+    col1, col2, col3 = st.columns([1,1,2])
+
+    with col1:
+        option_birthyear = st.selectbox(
+            "Birthyear",
+            birthyear_options,
+            key=key_birthyear,
+            index=birthyear_options.index(1997) if 1997 in birthyear_options else 0
+        )
+
+    with col2:
+        option_gender = st.selectbox(
+                                    "Gender",
+                                    ["M", "W"],
+                                    key=key_gender,
+                                    index=0
+                                )
+
+    tables, tables_sui = get_analytics(data_version).top3_tables(option_birthyear, option_gender)
+
+    for d, col in zip(DISCIPLINE_TITLES, st.columns([1,1,1,1])):
+        with col:
+            st.subheader(DISCIPLINE_TITLES[d])
+            show_table(tables[d])
+
+    # Only swiss athletes
+    for d, col in zip(DISCIPLINE_TITLES, st.columns([1,1,1,1])):
+        with col:
+            st.markdown(f"<h3 style='color:blue;'>{DISCIPLINE_TITLES[d]} SUI</h3>", unsafe_allow_html=True)
+            show_table(tables_sui[d])
+
+
+def render(data_version=None):
+
+    # Load the data (Change to read from pickle for easier solution)
+    data = get_latest_fis_list(data_version)
+
+    # Sort the data so the most recent year is at index 0 
+    birthyear_options = data["birthyear"].unique().tolist()
+    birthyear_options.sort(reverse=True)
+
+    top3_block(birthyear_options, data_version)
+    top3_block(birthyear_options, data_version, key_birthyear="by2", key_gender="gen2")
@@ -0,0 +1,82 @@
+"""
+"Top X" page: the best X of a birthyear range per discipline in the latest list, overall and SUI.
+"""
+import streamlit as st
+
+from views.common import get_analytics, get_latest_fis_list, show_table
+
+
+def render(data_version=None):
+    data = get_latest_fis_list(data_version)
+
+    # Sort the data so the most recent year is at index 0 
+    birthyear_options = data["birthyear"].unique().tolist()
+    birthyear_options.sort(reverse=True)
+
+    col1, col2, col3 = st.columns([1,2,3])
+
+    with col1:
+        birthyear_min = min(birthyear_options)
+        birthyear_max = max(birthyear_options)
+        birthyear_from = st.selectbox(
+            "Birthyear from",
+            birthyear_options,
+            index=birthyear_options.index(1997) if 1997 in birthyear_options else 0,
+            key="birthyear_from"
+        )
+        birthyear_to = st.selectbox(
+            "Birthyear to",
+            birthyear_options,
+            index=0,
+            key="birthyear_to"
+        )
+
+    with col2:
+        option_gender = st.selectbox(
+            "Gender",
+            ["M", "W"],
+            index=0
+        )
+    with col3:
+        top = st.number_input("Select Top X:", value=20, min_value=3, max_value=300)
+
+    # Ensure correct order for filtering
+    birthyears = (min(birthyear_from, birthyear_to), max(birthyear_from, birthyear_to))
+    tables, tables_sui = get_analytics(data_version).topX_tables(birthyears, option_gender, top)
+
+    col1_1, col1_2, col1_3, col1_4 = st.columns([1,1,1,1])
+
+    with col1_1:
+        st.subheader("Slalom")
+        show_table(tables["sl"], top, True)
+
+    with col1_2:
+        st.subheader("Giant Slalom")
+        show_table(tables["gs"], top, True)
+
+    with col1_3:
+        st.subheader("Super G")
+        show_table(tables["sg"], top, True)
+
+    with col1_4:
+        st.subheader("Downhill")
+        show_table(tables["dh"], top, True)
+
+
+    col2_1, col2_2, col2_3, col2_4 = st.columns([1,1,1,1])
+
+    with col2_1:
+        st.subheader("Slalom SUI")
+        show_table(tables_sui["sl"], 5)
+
+    with col2_2:
+        st.subheader("Giant Slalom SUI")
+        show_table(tables_sui["gs"], 5)
+
+    with col2_3:
+        st.subheader("Super G SUI")
+        show_table(tables_sui["sg"], 5)
+
+    with col2_4:
+        st.subheader("Downhill SUI")
+        show_table(tables_sui["dh"], 5)